@@ -3,13 +3,41 @@
 import requests
 import random
 import time
+import asyncio
+import aiohttp
 import re
 from pathlib import Path
 from datetime import datetime
 from urllib.parse import quote_plus
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+# Event-loop scraping shares one keep-alive connection pool (see get_async_session)
+_async_session = None
+_async_session_loop = None
+
+
+def get_async_session():
+    """Return the process-wide aiohttp session, creating it on first use inside the running loop"""
+    global _async_session, _async_session_loop
+    loop = asyncio.get_running_loop()
+    # A session is bound to the loop that created it
+    if _async_session is None or _async_session.closed or _async_session_loop is not loop:
+        _async_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=50, limit_per_host=10)
+        )
+        _async_session_loop = loop
+    return _async_session
+
+
+async def close_async_session():
+    """Close the process-wide aiohttp session"""
+    global _async_session, _async_session_loop
+    if _async_session is not None and not _async_session.closed:
+        await _async_session.close()
+    _async_session = None
+    _async_session_loop = None
 
 
 class AmazonKeywordScraper:
@@ -26,16 +54,36 @@ class AmazonKeywordScraper:
         "en-US,en;q=0.9,es;q=0.8",
     ]
 
-    def __init__(self, max_retries=3):
+    # Attribute that marks each search-result card in the page source
+    SEARCH_RESULT_MARKER = 'data-component-type="s-search-result"'
+
+    # Only the search-result cards are built into the parse tree
+    SEARCH_RESULT_STRAINER = SoupStrainer('div', attrs={'data-component-type': 's-search-result'})
+
+    def __init__(self, max_retries=3, session=None):
         self.max_retries = max_retries
-        self.session = self._create_session()
+        # A shared session is owned (and closed) by the caller that passed it in
+        self._owns_session = session is None
+        # Created on first use: the async methods never need a requests session
+        self._session = session
+
+    @property
+    def session(self):
+        if self._session is None:
+            self._session = self._create_session()
+        return self._session
 
     def _create_session(self):
         """Create session with retry strategy"""
+        return self.create_session(max_retries=self.max_retries)
+
+    @staticmethod
+    def create_session(max_retries=3, pool_connections=10, pool_maxsize=10):
+        """Create pooled session with retry strategy (shareable across scrapers)"""
         session = requests.Session()
-        
+
         retry_strategy = Retry(
-            total=self.max_retries,
+            total=max_retries,
             backoff_factor=2,
             status_forcelist=[429, 500, 502, 503, 504, 522, 524],
             allowed_methods=["GET"],
@@ -44,8 +92,8 @@ class AmazonKeywordScraper:
         
         adapter = HTTPAdapter(
             max_retries=retry_strategy,
-            pool_connections=10,
-            pool_maxsize=10
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize
         )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
@@ -72,6 +120,16 @@ class AmazonKeywordScraper:
         """Random delay"""
         time.sleep(random.uniform(min_sec, max_sec))
 
+    async def _async_delay(self, min_sec=3, max_sec=6):
+        """Random delay that yields to the event loop"""
+        await asyncio.sleep(random.uniform(min_sec, max_sec))
+
+    def _async_headers(self):
+        """Stealth headers without brotli, which aiohttp can't decode unless Brotli is installed"""
+        headers = self._headers()
+        headers["Accept-Encoding"] = "gzip, deflate"
+        return headers
+
     def _is_blocked(self, html):
         """Check if response indicates blocking"""
         html_lower = html.lower()
@@ -166,9 +224,124 @@ class AmazonKeywordScraper:
         
         raise Exception("Failed to scrape after all retries")
 
-    def extract_product_titles(self, html):
-        """Extract non-sponsored product titles from HTML"""
-        soup = BeautifulSoup(html, 'html.parser')
+    async def async_warm_up(self, session=None):
+        """Visit Amazon homepage to establish cookies in an aiohttp session"""
+        session = session or get_async_session()
+        print("🔄 Warming up session...")
+        try:
+            async with session.get(
+                "https://www.amazon.com/",
+                headers=self._async_headers(),
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                if response.status == 200:
+                    print("✅ Session warmed up successfully")
+                else:
+                    print(f"⚠️  Warm-up returned status {response.status}")
+        except Exception as e:
+            print(f"⚠️  Warm-up failed: {e}")
+
+        await self._async_delay(2, 3)
+
+    async def async_scrape_search_html(self, keyword, page=1, session=None):
+        """Scrape search results over aiohttp with the same retry logic as scrape_search_html"""
+        session = session or get_async_session()
+        url = self.build_search_url(keyword, page)
+
+        for attempt in range(1, self.max_retries + 1):
+            print(f"🌐 Attempt {attempt}/{self.max_retries}: {url}")
+
+            try:
+                await self._async_delay()
+
+                async with session.get(
+                    url,
+                    headers=self._async_headers(),
+                    timeout=aiohttp.ClientTimeout(total=45),
+                    allow_redirects=True
+                ) as response:
+                    status = response.status
+                    html = await response.text() if status == 200 else ""
+
+                if status != 200:
+                    print(f"⚠️  HTTP {status}")
+                    if attempt < self.max_retries:
+                        wait_time = 2 ** attempt
+                        print(f"⏳ Waiting {wait_time}s before retry...")
+                        await asyncio.sleep(wait_time)
+                        continue
+                    else:
+                        raise Exception(f"HTTP {status} after {self.max_retries} attempts")
+
+                if self._is_blocked(html):
+                    print(f"🚫 Blocked by Amazon (attempt {attempt}/{self.max_retries})")
+                    if attempt < self.max_retries:
+                        wait_time = 2 ** (attempt + 1)
+                        print(f"⏳ Waiting {wait_time}s before retry...")
+                        await asyncio.sleep(wait_time)
+                        continue
+                    else:
+                        raise Exception("Blocked by Amazon (captcha/503) after all retries")
+
+                if len(html) < 10000:
+                    print(f"⚠️  Response too short ({len(html)} bytes)")
+                    if attempt < self.max_retries:
+                        await asyncio.sleep(2 ** attempt)
+                        continue
+                    else:
+                        raise Exception(f"Response too short ({len(html)} bytes)")
+
+                print(f"✅ Successfully fetched HTML ({len(html)} bytes)")
+                return html
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"⚠️  Request error: {e}")
+                if attempt < self.max_retries:
+                    await asyncio.sleep(2 ** attempt)
+                    continue
+                else:
+                    raise Exception(f"Request failed after {self.max_retries} attempts: {e}")
+
+        raise Exception("Failed to scrape after all retries")
+
+    def _search_result_region(self, html, limit=None):
+        """
+        Slice html down to the result cards a `limit`-title parse needs
+
+        Starts at the first result card and, with a limit, ends before card
+        2 * limit + 1 to leave room for skipped sponsored cards. Returns
+        (region, truncated_at_end), or (html, False) if no card marker is found.
+        """
+        marker = self.SEARCH_RESULT_MARKER
+        first = html.find(marker)
+        if first == -1:
+            return html, False
+        start = html.rfind('<', 0, first)
+
+        if limit:
+            pos = first
+            for _ in range(2 * limit):
+                pos = html.find(marker, pos + len(marker))
+                if pos == -1:
+                    break
+            else:
+                return html[start:html.rfind('<', 0, pos)], True
+
+        return html[start:], False
+
+    def extract_product_titles(self, html, limit=None):
+        """Extract non-sponsored product titles from HTML (the first `limit` if given)"""
+        region, truncated = self._search_result_region(html, limit)
+        titles = self._parse_product_titles(region, limit)
+
+        # Too many sponsored/untitled cards in the slice; parse the whole page instead
+        if truncated and len(titles) < limit:
+            titles = self._parse_product_titles(html, limit)
+
+        return titles
+
+    def _parse_product_titles(self, html, limit=None):
+        soup = BeautifulSoup(html, 'lxml', parse_only=self.SEARCH_RESULT_STRAINER)
         product_items = soup.find_all('div', {'data-component-type': 's-search-result'})
         
         titles = []
@@ -186,6 +359,8 @@ class AmazonKeywordScraper:
                 if span_tag:
                     title = span_tag.get_text(strip=True)
                     titles.append(title)
+                    if limit and len(titles) >= limit:
+                        break
         
         return titles
 
@@ -205,7 +380,9 @@ class AmazonKeywordScraper:
         return file_path
 
     def close(self):
-        self.session.close()
+        if self._owns_session and self._session is not None:
+            self._session.close()
+            self._session = None
 
 
 def main():
@@ -1,7 +1,7 @@
 """
 Research endpoint for processing Amazon product analysis
 """
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException
+from fastapi import APIRouter, Request, UploadFile, File, Form, HTTPException
 from fastapi.responses import FileResponse
 import logging
 import asyncio
@@ -18,12 +18,16 @@ progress_store = {}
 
 @router.post("/research/json")
 async def analyze_product_json(
+    request: Request,
     design_csv: UploadFile = File(..., description="Design CSV file"),
     revenue_csv: UploadFile = File(..., description="Revenue CSV file"),
     asin_or_url: str = Form(..., description="Amazon ASIN or product URL"),
     marketplace: str = Form(default="US", description="Marketplace code (US, UK, CA, etc.)"),
     use_mock_scraper: bool = Form(default=False, description="Use mock data for testing"),
     use_direct_verification: bool = Form(default=False, description="Use direct verification method (scrape all irrelevant keywords)"),
+    force_rescrape: bool = Form(
+        default=False, description="Ignore competitor titles and verdicts cached by earlier runs"
+    ),
     request_id: str = Form(default="", description="Request ID for progress tracking")
 ):
     """
@@ -47,8 +51,11 @@ async def analyze_product_json(
         design_content = await design_csv.read()
         revenue_content = await revenue_csv.read()
         
-        # Initialize pipeline
-        pipeline = ResearchPipeline()
+        # Initialize pipeline on the app-wide scraper pool and HTTP session
+        pipeline = ResearchPipeline(
+            scraper_pool=request.app.state.scraper_pool,
+            http_session=request.app.state.requests_session
+        )
         
         # Progress callback
         async def update_progress(percent, message):
@@ -64,7 +71,8 @@ async def analyze_product_json(
             use_mock_scraper=use_mock_scraper,
             use_direct_verification=use_direct_verification,
             progress_callback=update_progress,
-            request_id=request_id if request_id else None
+            request_id=request_id if request_id else None,
+            force_rescrape=force_rescrape
         )
         
         # Clean up progress
@@ -0,0 +1,40 @@
+"""
+Structured-output extraction shared by the LLM-backed services
+"""
+import json
+from typing import Any, Dict
+
+from pydantic import BaseModel
+
+# Decodes the JSON value starting at a given offset of free-text agent output
+JSON_DECODER = json.JSONDecoder()
+
+
+def extract_structured_output(output: Any) -> Dict[str, Any]:
+    """Extract structured data from agent output"""
+    if output is None:
+        return {}
+    if isinstance(output, BaseModel):
+        return output.model_dump()
+    elif isinstance(output, dict):
+        return output
+    elif isinstance(output, str):
+        return extract_json_from_string(output)
+    return {}
+
+
+def extract_json_from_string(text: str) -> Dict[str, Any]:
+    """Extract the first complete JSON object from free text"""
+    if not text:
+        return {}
+    # Scan each '{' in turn and take the first complete JSON object
+    start = text.find('{')
+    while start != -1:
+        try:
+            obj, _ = JSON_DECODER.raw_decode(text, start)
+            if isinstance(obj, dict):
+                return obj
+        except json.JSONDecodeError:
+            pass
+        start = text.find('{', start + 1)
+    return {}
@@ -0,0 +1,84 @@
+"""
+Shared async batch runner for the LLM-backed services
+"""
+import logging
+import asyncio
+import itertools
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+async def iter_batched(
+    items: Sequence[Any],
+    batch_size: int,
+    worker: Callable[[List[Any]], Awaitable[Any]],
+    max_concurrent: int = 10,
+    progress_callback=None,
+    progress_range: Tuple[float, float] = (0, 100),
+    label: str = "Processing"
+) -> AsyncIterator[Any]:
+    """
+    Run worker over fixed-size batches of items, at most max_concurrent at a time
+
+    Batches are sliced and scheduled lazily: a new one starts only when a
+    running one finishes, so only max_concurrent prompts exist at once.
+
+    Yields:
+        Each batch's worker result as soon as that batch completes
+    """
+    n_batches = -(-len(items) // batch_size)
+    logger.info(f"{label}: {len(items)} keywords in {n_batches} batches")
+
+    batch_iter = (items[i:i + batch_size] for i in range(0, len(items), batch_size))
+    completed_counter = itertools.count(1)
+    progress_lo, progress_hi = progress_range
+
+    async def process_batch(batch):
+        result = await worker(batch)
+
+        completed = next(completed_counter)
+        if progress_callback:
+            progress = progress_lo + (completed / n_batches) * (progress_hi - progress_lo)
+            await progress_callback(progress, f"{label} ({completed}/{n_batches} batches)...")
+
+        return result
+
+    pending = {asyncio.ensure_future(process_batch(batch))
+               for batch in itertools.islice(batch_iter, max(1, max_concurrent))}
+
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            # Refill the freed slots before handing results to the consumer
+            for batch in itertools.islice(batch_iter, len(done)):
+                pending.add(asyncio.ensure_future(process_batch(batch)))
+            for task in done:
+                yield task.result()
+    finally:
+        # Batches are only still pending if the consumer stopped early or a worker raised
+        for task in pending:
+            task.cancel()
+
+
+async def run_batched(
+    items: Sequence[Any],
+    batch_size: int,
+    worker: Callable[[List[Any]], Awaitable[List[Any]]],
+    max_concurrent: int = 10,
+    progress_callback=None,
+    progress_range: Tuple[float, float] = (0, 100),
+    label: str = "Processing"
+) -> List[Any]:
+    """
+    Run worker over batches of items and flatten the returned lists
+
+    Returns:
+        Non-empty results from every batch, in completion order
+    """
+    results = []
+    async for batch_result in iter_batched(
+        items, batch_size, worker, max_concurrent, progress_callback, progress_range, label
+    ):
+        results.extend(item for item in batch_result if item)
+    return results
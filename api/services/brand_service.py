@@ -2,26 +2,38 @@
 Brand detection service
 """
 import logging
-import json
+import orjson
 import asyncio
-from typing import List, Tuple, Dict, Any
+import os
+from typing import List, Tuple
 from pathlib import Path
 from datetime import datetime
 import csv
+from itertools import chain
 
 from agents import Runner
+from api.services.agent_output import extract_structured_output
+from api.services.batching import iter_batched
+from api.services.rate_limiting import AsyncRateLimiter, run_with_retry
 from research_agents.brand_agents import brand_detection_agent
 from research_agents.prompts import BRAND_DETECTION_PROMPT_TEMPLATE
 
 logger = logging.getLogger(__name__)
 
+# Brand-detection requests per minute, across every pipeline run in the process
+BRAND_DETECTION_RPM = int(os.getenv("BRAND_DETECTION_RPM", "500"))
+
+# One limiter per process: a limiter per service instance would allow RPM per concurrent request
+BRAND_RATE_LIMITER = AsyncRateLimiter(BRAND_DETECTION_RPM)
+
 class BrandService:
     """Handle brand detection for keywords"""
     
     async def detect_brands(
         self, 
         keywords: List[str],
-        max_concurrent: int = 10
+        max_concurrent: int = 10,
+        progress_callback=None
     ) -> Tuple[List[str], List[str]]:
         """
         Detect branded vs non-branded keywords
@@ -31,44 +43,42 @@ class BrandService:
         """
         try:
             batch_size = 50
-            batches = [keywords[i:i + batch_size] for i in range(0, len(keywords), batch_size)]
-            
-            logger.info(f"Brand detection: {len(keywords)} keywords in {len(batches)} batches")
-            
-            semaphore = asyncio.Semaphore(max_concurrent)
-            all_branded = []
-            all_non_branded = []
             
-            async def process_batch(batch):
-                async with semaphore:
-                    try:
-                        prompt = BRAND_DETECTION_PROMPT_TEMPLATE.format(
-                            keywords_json=json.dumps(batch, indent=2)
-                        )
-                        
-                        result = await Runner.run(brand_detection_agent, prompt)
-                        detection_raw = getattr(result, "final_output", None)
-                        detection_structured = self._extract_structured_output(detection_raw)
-                        
-                        branded = detection_structured.get("branded_keywords", [])
-                        non_branded = detection_structured.get("non_branded_keywords", [])
-                        
-                        return branded, non_branded
-                    except Exception as e:
-                        logger.error(f"Error in brand detection batch: {str(e)}")
-                        return [], batch
+            async def detect_batch(batch):
+                try:
+                    prompt = BRAND_DETECTION_PROMPT_TEMPLATE.format(
+                        keywords_json=orjson.dumps(batch, option=orjson.OPT_INDENT_2).decode()
+                    )
+                    
+                    result = await run_with_retry(
+                        lambda: Runner.run(brand_detection_agent, prompt),
+                        limiter=BRAND_RATE_LIMITER,
+                        label="Brand detection batch"
+                    )
+                    detection_raw = getattr(result, "final_output", None)
+                    detection_structured = extract_structured_output(detection_raw)
+                    
+                    branded = detection_structured.get("branded_keywords", [])
+                    non_branded = detection_structured.get("non_branded_keywords", [])
+                    
+                    return branded, non_branded
+                except Exception as e:
+                    logger.error(f"Error in brand detection batch: {str(e)}")
+                    return [], batch
             
-            tasks = [process_batch(batch) for batch in batches]
-            results = await asyncio.gather(*tasks)
-            
-            for branded, non_branded in results:
-                all_branded.extend(branded)
-                all_non_branded.extend(non_branded)
+            results = [
+                batch_result async for batch_result in iter_batched(
+                    keywords, batch_size, detect_batch, max_concurrent,
+                    progress_callback, progress_range=(28, 44), label="Brand detection"
+                )
+            ]
+            all_branded = list(chain.from_iterable(branded for branded, _ in results))
+            all_non_branded = list(chain.from_iterable(non_branded for _, non_branded in results))
             
             logger.info(f"Brand detection: {len(all_branded)} branded, {len(all_non_branded)} non-branded")
             
             # Save classifications
-            self._save_brand_classifications(all_branded, all_non_branded)
+            await asyncio.to_thread(self._save_brand_classifications, all_branded, all_non_branded)
             
             return all_branded, all_non_branded
             
@@ -76,31 +86,6 @@ class BrandService:
             logger.error(f"Error in brand detection: {str(e)}")
             return [], keywords
     
-    def _extract_structured_output(self, output: Any) -> Dict[str, Any]:
-        """Extract structured data from agent output"""
-        if output and hasattr(output, "model_dump"):
-            return output.model_dump()
-        elif isinstance(output, dict):
-            return output
-        elif isinstance(output, str):
-            return self._extract_json_from_string(output)
-        return {}
-    
-    def _extract_json_from_string(self, text: str) -> Dict[str, Any]:
-        """Extract JSON from string"""
-        import re
-        if not text:
-            return {}
-        matches = re.findall(r"\{[\s\S]*\}", text)
-        for snippet in reversed(matches):
-            try:
-                obj = json.loads(snippet)
-                if isinstance(obj, dict):
-                    return obj
-            except Exception:
-                continue
-        return {}
-    
     def _save_brand_classifications(self, branded: List[str], non_branded: List[str]):
         """Save brand classifications to CSV"""
         try:
@@ -0,0 +1,48 @@
+"""
+In-process TTL caches shared across pipeline runs
+"""
+import os
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+# Seconds a scraped title list / verification verdict stays reusable
+SCRAPE_CACHE_TTL = float(os.getenv("SCRAPE_CACHE_TTL", "86400"))
+
+
+class TTLCache:
+    """Thread-safe LRU mapping whose entries expire ttl seconds after being set"""
+
+    def __init__(self, ttl: float, maxsize: int = 10000):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+# Organic search-result titles keyed by (normalized keyword, title limit)
+SCRAPED_TITLES_CACHE = TTLCache(SCRAPE_CACHE_TTL)
+
+# Competitor-verification results keyed by (keyword, product title, bullets, titles)
+VERIFICATION_CACHE = TTLCache(SCRAPE_CACHE_TTL)
@@ -2,23 +2,43 @@
 Keyword categorization service
 """
 import logging
-import json
-import asyncio
-from typing import List, Dict, Any
+import orjson
+import os
+from typing import List, Dict, Any, AsyncIterator, Optional
 
 from agents import Runner
+from api.services.agent_output import extract_structured_output
+from api.services.batching import iter_batched
 from research_agents.categorization_agent import categorization_agent
-from research_agents.prompts import KEYWORD_CATEGORIZATION_PROMPT_TEMPLATE
+from research_agents.categorization_validation_agent import categorization_validation_agent
+from research_agents.prompts import (
+    KEYWORD_CATEGORIZATION_PROMPT_TEMPLATE,
+    CATEGORIZATION_AND_VALIDATION_PROMPT_TEMPLATE
+)
 
 logger = logging.getLogger(__name__)
 
+# Output tokens budgeted per keyword. A fused entry (category plus two 1-2 sentence
+# reasonings) serializes to ~430 characters, ~110 tokens; the rest of the budget is
+# headroom for the gpt-5 reasoning tokens spent on that keyword
+OUTPUT_TOKENS_PER_KEYWORD = 500
+
+# Keywords per LLM call; unset, each agent's batch is sized to fit its max_tokens budget
+CATEGORIZATION_BATCH_SIZE = int(os.getenv("CATEGORIZATION_BATCH_SIZE", "0")) or None
+
+
+def adaptive_batch_size(agent) -> int:
+    """Keywords per call whose output fits agent's max_tokens, clamped to 8-64"""
+    return max(8, min(64, agent.model_settings.max_tokens // OUTPUT_TOKENS_PER_KEYWORD))
+
+
 class CategorizationService:
     """Handle keyword categorization"""
     
     async def categorize_keywords(
         self,
         keywords: List[str],
-        batch_size: int = 5,
+        batch_size: Optional[int] = CATEGORIZATION_BATCH_SIZE,
         max_concurrent: int = 10,
         progress_callback=None
     ) -> List[Dict[str, Any]]:
@@ -28,64 +48,99 @@ class CategorizationService:
         Returns:
             List of categorizations with keyword, category, reasoning
         """
-        batches = [keywords[i:i + batch_size] for i in range(0, len(keywords), batch_size)]
-        logger.info(f"Categorizing {len(keywords)} keywords in {len(batches)} batches")
-        
-        semaphore = asyncio.Semaphore(max_concurrent)
-        completed = 0
-        
-        async def process_batch(batch):
-            nonlocal completed
-            async with semaphore:
-                try:
-                    prompt = KEYWORD_CATEGORIZATION_PROMPT_TEMPLATE.format(
-                        keywords_json=json.dumps(batch, indent=2)
-                    )
-                    
-                    result = await Runner.run(categorization_agent, prompt)
-                    raw_output = getattr(result, "final_output", None)
-                    structured = self._extract_structured_output(raw_output)
-                    
-                    completed += 1
-                    if progress_callback:
-                        progress = 70 + (completed / len(batches)) * 25
-                        await progress_callback(progress, f"Categorizing ({completed}/{len(batches)} batches)...")
-                    
-                    return structured.get("categorizations", [])
-                except Exception as e:
-                    logger.error(f"Error categorizing batch: {str(e)}")
-                    completed += 1
-                    return []
-        
-        tasks = [process_batch(batch) for batch in batches]
-        results = await asyncio.gather(*tasks)
+        categorizations = []
+        async for batch_result in self.categorize_keywords_stream(
+            keywords, batch_size, max_concurrent, progress_callback
+        ):
+            categorizations.extend(batch_result)
         
-        categorizations = [cat for batch in results for cat in batch if cat]
         logger.info(f"Categorization complete: {len(categorizations)} results")
         
         return categorizations
     
-    def _extract_structured_output(self, output: Any) -> Dict[str, Any]:
-        """Extract structured data from agent output"""
-        if output and hasattr(output, "model_dump"):
-            return output.model_dump()
-        elif isinstance(output, dict):
-            return output
-        elif isinstance(output, str):
-            return self._extract_json_from_string(output)
-        return {}
+    async def categorize_keywords_stream(
+        self,
+        keywords: List[str],
+        batch_size: Optional[int] = CATEGORIZATION_BATCH_SIZE,
+        max_concurrent: int = 10,
+        progress_callback=None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Categorize keywords, yielding each batch's categorizations as soon as it completes
+        
+        Yields:
+            List of categorizations (keyword, category, reasoning) for one finished batch
+        """
+        def build_prompt(batch):
+            return KEYWORD_CATEGORIZATION_PROMPT_TEMPLATE.format(
+                keywords_json=orjson.dumps(batch, option=orjson.OPT_INDENT_2).decode()
+            )
+        
+        async for batch_result in self._stream_batches(
+            keywords, categorization_agent, build_prompt, "Categorizing",
+            batch_size, max_concurrent, progress_callback
+        ):
+            yield batch_result
+    
+    async def categorize_and_validate_stream(
+        self,
+        keywords: List[str],
+        product_title: str,
+        product_bullets: List[str],
+        batch_size: Optional[int] = CATEGORIZATION_BATCH_SIZE,
+        max_concurrent: int = 10,
+        progress_callback=None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Categorize keywords and validate them against the product title/bullets
+        in a single LLM call per batch
+        
+        Yields:
+            List of categorizations (keyword, category, reasoning, is_irrelevant,
+            irrelevant_reasoning) for one finished batch
+        """
+        product_bullets_json = orjson.dumps(product_bullets, option=orjson.OPT_INDENT_2).decode()
+        
+        def build_prompt(batch):
+            return CATEGORIZATION_AND_VALIDATION_PROMPT_TEMPLATE.format(
+                product_title=product_title,
+                product_bullets_json=product_bullets_json,
+                keywords_json=orjson.dumps(batch, option=orjson.OPT_INDENT_2).decode()
+            )
+        
+        async for batch_result in self._stream_batches(
+            keywords, categorization_validation_agent, build_prompt, "Categorizing and validating",
+            batch_size, max_concurrent, progress_callback
+        ):
+            yield batch_result
     
-    def _extract_json_from_string(self, text: str) -> Dict[str, Any]:
-        """Extract JSON from string"""
-        import re
-        if not text:
-            return {}
-        matches = re.findall(r"\{[\s\S]*\}", text)
-        for snippet in reversed(matches):
+    async def _stream_batches(
+        self,
+        keywords: List[str],
+        agent,
+        build_prompt,
+        label: str,
+        batch_size: Optional[int],
+        max_concurrent: int,
+        progress_callback
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Run the agent over keyword batches, yielding each batch's categorizations as it completes"""
+        batch_size = batch_size or adaptive_batch_size(agent)
+        
+        async def categorize_batch(batch):
             try:
-                obj = json.loads(snippet)
-                if isinstance(obj, dict):
-                    return obj
-            except Exception:
-                continue
-        return {}
+                result = await Runner.run(agent, build_prompt(batch))
+                raw_output = getattr(result, "final_output", None)
+                structured = extract_structured_output(raw_output)
+                return structured.get("categorizations", [])
+            except Exception as e:
+                logger.error(f"Error categorizing batch: {str(e)}")
+                return []
+        
+        async for categorizations in iter_batched(
+            keywords, batch_size, categorize_batch, max_concurrent,
+            progress_callback, progress_range=(70, 95), label=label
+        ):
+            batch_result = [cat for cat in categorizations if cat]
+            if batch_result:
+                yield batch_result
@@ -5,6 +5,7 @@ import csv
 import io
 from typing import List, Dict, Any, Set
 from collections import Counter
+from operator import itemgetter
 import logging
 
 logger = logging.getLogger(__name__)
@@ -32,6 +33,10 @@ class CSVProcessor:
         for row in reader:
             # Create new dict with stripped keys
             clean_row = {k.strip(): v for k, v in row.items()}
+            # Short rows come back with None for missing cells; validate the keyword once
+            # here so later stages can call str methods on it without per-row guards
+            if not isinstance(clean_row.get('Keyword Phrase'), str):
+                continue
             rows.append(clean_row)
         return rows
     
@@ -87,12 +92,16 @@ class CSVProcessor:
         """Add relevancy column based on B0 columns with values < 11"""
         logger.info(f"Adding relevancy to {len(rows)} rows")
         
+        # Rows share the filtered schema, so find the competitor ASIN (B0) columns once
+        asin_cols = [col for col in rows[0] if col.startswith('B0')] if rows else []
+        
         rows_with_relevancy = []
         for row in rows:
             # Count B0 columns with values < 11
             relevancy = 0
-            for col, value in row.items():
-                if col.startswith('B0') and value and str(value).strip():
+            for col in asin_cols:
+                value = row.get(col)
+                if value and str(value).strip():
                     try:
                         val = float(value)
                         if val < 11:
@@ -104,8 +113,8 @@ class CSVProcessor:
             if relevancy >= 2:  # Keep only relevancy >= 2
                 rows_with_relevancy.append(row)
         
-        # Sort by relevancy descending
-        rows_with_relevancy.sort(key=lambda x: int(x.get('relevancy', 0)), reverse=True)
+        # Sort by relevancy descending (always an int set above, so no per-row coercion)
+        rows_with_relevancy.sort(key=itemgetter('relevancy'), reverse=True)
         
         logger.info(f"Filtered to {len(rows_with_relevancy)} rows with relevancy >= 2")
         return rows_with_relevancy
@@ -115,24 +124,21 @@ class CSVProcessor:
         """Extract and count root keywords from both CSVs"""
         logger.info("Extracting root keywords")
         
-        all_tokens = []
+        token_counts = Counter()
         
         # Process both design and revenue rows
         for rows in [design_rows, revenue_rows]:
             for row in rows:
-                keyword_phrase = row.get('Keyword Phrase', '').strip()
-                if keyword_phrase:
-                    # Tokenize by spaces
-                    tokens = keyword_phrase.lower().split()
-                    # Remove stop words
-                    filtered_tokens = [token for token in tokens if token not in STOP_WORDS and token]
-                    all_tokens.extend(filtered_tokens)
-        
-        # Count frequencies
-        token_counts = Counter(all_tokens)
-        
-        # Sort by frequency descending
-        sorted_tokens = sorted(token_counts.items(), key=lambda x: x[1], reverse=True)
+                # Reuse the pipeline's cached normalized keyword when present
+                keyword_lower = row.get('_kw_lower')
+                if keyword_lower is None:
+                    keyword_lower = row.get('Keyword Phrase', '').strip().lower()
+                if keyword_lower:
+                    # Tokenize by spaces and count everything but stop words
+                    token_counts.update(token for token in keyword_lower.split() if token not in STOP_WORDS)
+        
+        # Sort by frequency descending (most_common keeps first-seen order for ties)
+        sorted_tokens = token_counts.most_common()
         
         # Convert to list of dicts
         root_keywords = [
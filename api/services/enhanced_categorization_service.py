@@ -4,6 +4,7 @@ Categorizes irrelevant keywords as 'irrelevant' or 'competitor_relevant'
 using Python logic + competitor title scraping
 """
 import logging
+import heapq
 from typing import List, Dict, Any
 
 from research_agents.enhanced_irrelevant_logic import categorize_irrelevant_keywords
@@ -11,6 +12,9 @@ from Experimental.amazon_keyword_scraper import AmazonKeywordScraper
 
 logger = logging.getLogger(__name__)
 
+# Categories whose keywords are used to pick the competitor search terms
+RELEVANT_CATEGORIES = frozenset(('relevant', 'design_specific'))
+
 class EnhancedCategorizationService:
     """
     Categorize irrelevant keywords using Python logic and competitor scraping
@@ -25,32 +29,41 @@ class EnhancedCategorizationService:
     7. If not found → 'irrelevant' (no market demand)
     """
     
+    def __init__(self, session=None):
+        # Optional shared requests.Session reused by the competitor scraper
+        self.session = session
+    
     def categorize_irrelevant_keywords(
         self,
-        keyword_evaluations: List[Dict[str, Any]]
+        keyword_evaluations: List[Dict[str, Any]],
+        row_index: Dict[str, Dict[str, Any]]
     ) -> Dict[str, str]:
         """
         Categorize irrelevant keywords as 'irrelevant' or 'competitor_relevant'
         
         Args:
-            keyword_evaluations: List of keyword categorizations with category and search volume
+            keyword_evaluations: List of keyword categorizations with category and _kw_lower
+            row_index: Dict mapping normalized keyword to its CSV row (for search volume)
         
         Returns:
             Dict mapping keyword to enhanced category ('irrelevant' or 'competitor_relevant')
         """
-        # Extract irrelevant keywords
-        irrelevant_keywords = [
-            cat.get('keyword') for cat in keyword_evaluations 
-            if cat.get('category') == 'irrelevant'
-        ]
-        
-        # Get top 3 relevant keywords by search volume
-        relevant_keywords_sorted = sorted(
-            [cat for cat in keyword_evaluations 
-             if cat.get('category') in ['relevant', 'design_specific']],
-            key=lambda x: int(x.get('Search Volume', 0)) if x.get('Search Volume') else 0,
-            reverse=True
-        )[:3]
+        # Get top 3 relevant keywords by search volume (looked up only for relevant rows)
+        def search_volume(cat):
+            volume = row_index.get(cat['_kw_lower'], {}).get('Search Volume')
+            return int(volume) if volume else 0
+        
+        # Split irrelevant keywords and relevant candidates in a single pass
+        irrelevant_keywords = []
+        relevant_candidates = []
+        for cat in keyword_evaluations:
+            category = cat.get('category')
+            if category == 'irrelevant':
+                irrelevant_keywords.append(cat.get('keyword'))
+            elif category in RELEVANT_CATEGORIES:
+                relevant_candidates.append(cat)
+        
+        relevant_keywords_sorted = heapq.nlargest(3, relevant_candidates, key=search_volume)
         
         relevant_keywords = [cat.get('keyword') for cat in relevant_keywords_sorted]
         
@@ -106,7 +119,7 @@ class EnhancedCategorizationService:
             List of organic competitor product titles (~144 titles: 3 keywords × ~48 organic titles each)
         """
         all_titles = []
-        scraper = AmazonKeywordScraper()
+        scraper = AmazonKeywordScraper(session=self.session)
         
         try:
             scraper.warm_up()
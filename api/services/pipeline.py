@@ -2,36 +2,61 @@
 Simplified research pipeline - orchestrates services
 """
 import logging
-from typing import Dict, Any, List, Optional
+import asyncio
+import re
+from typing import Dict, Any, List, Optional, Set
 from pathlib import Path
 from datetime import datetime
 import csv
+from collections import defaultdict
+from itertools import chain
+from operator import itemgetter
+
+import pandas as pd
 
 from api.services.csv_processor import CSVProcessor
 from api.services.logging_config import setup_run_logger, RunLogger
 from api.services.brand_service import BrandService
 from api.services.categorization_service import CategorizationService
-from api.services.scraper_service import ScraperService
-from api.services.validation_service import ValidationService
+from api.services.scraper_service import ScraperService, FILENAME_UNSAFE_CHARS
+from api.services.validation_service import ValidationResultsWriter
 from api.services.verification_service import VerificationService
 from api.services.enhanced_categorization_service import EnhancedCategorizationService
 from api.services.direct_verification_service import DirectVerificationService
+from api.services.scraper_pool import ScraperPool
 
 logger = logging.getLogger(__name__)
 
+# Relevance score per final category; anything unlisted scores DEFAULT_RELEVANCE_SCORE
+CATEGORY_SCORE = {
+    'irrelevant': 3,
+    'competitor_relevant': 4,
+    'outlier': 5,
+    'relevant': 8,
+    'design_specific': 10,
+    'branded': 2
+}
+DEFAULT_RELEVANCE_SCORE = 7
+
+# Final results keep keywords scoring at least MIN_RELEVANCE_SCORE, plus these categories regardless of score
+MIN_RELEVANCE_SCORE = 5
+ALWAYS_KEEP_CATEGORIES = frozenset({'branded', 'irrelevant', 'competitor_relevant'})
+
 class ResearchPipeline:
     """Simplified pipeline orchestrating specialized services"""
     
-    def __init__(self):
+    def __init__(self, scraper_pool: Optional[ScraperPool] = None, http_session=None):
         self.csv_processor = CSVProcessor()
         self.brand_service = BrandService()
         self.categorization_service = CategorizationService()
         self.scraper_service = ScraperService()
-        self.validation_service = ValidationService()
-        self.verification_service = VerificationService()
-        self.enhanced_categorization_service = EnhancedCategorizationService()
-        self.direct_verification_service = DirectVerificationService()
+        # Competitor-title scrapes go through the app-wide pool when one is given
+        self.verification_service = VerificationService(scraper_pool=scraper_pool)
+        # Optional app-wide requests.Session, so the top-keyword scrapes reuse pooled TCP/TLS connections
+        self.enhanced_categorization_service = EnhancedCategorizationService(session=http_session)
+        self.direct_verification_service = DirectVerificationService(scraper_pool=scraper_pool)
         self.run_logger: Optional[RunLogger] = None
+        self._background_tasks: Set[asyncio.Task] = set()
     
     async def run_complete_pipeline(
         self,
@@ -42,7 +67,8 @@ class ResearchPipeline:
         use_mock_scraper: bool = False,
         use_direct_verification: bool = False,
         progress_callback=None,
-        request_id: str = None
+        request_id: str = None,
+        force_rescrape: bool = False
     ) -> Dict[str, Any]:
         """Run complete research pipeline"""
         
@@ -53,14 +79,24 @@ class ResearchPipeline:
         else:
             run_log = logger
         
+        # Progress updates are scheduled as tasks so a slow sink never stalls the pipeline
+        progress_callback = self._nonblocking_progress(progress_callback)
+        scrape_task = None
+        
         try:
             run_log.info(f"Pipeline started: {asin_or_url}")
             
+            # The Amazon scrape only needs the ASIN, so start it before CSV parsing
+            scrape_task = asyncio.ensure_future(
+                asyncio.to_thread(self.scraper_service.scrape_product, asin_or_url, marketplace, use_mock_scraper)
+            )
+            
             # Step 1-4: CSV Processing (10-25%)
             if progress_callback:
                 await progress_callback(10, "Processing CSV files...")
             
-            design_rows, revenue_rows = self._process_csvs(
+            design_rows, revenue_rows = await asyncio.to_thread(
+                self._process_csvs,
                 design_csv_content, 
                 revenue_csv_content
             )
@@ -68,38 +104,28 @@ class ResearchPipeline:
             if not design_rows and not revenue_rows:
                 return self._error_response("No valid keywords found in CSV files")
             
-            # Step 5: Extract root keywords (28-32%)
+            # Step 5-6: Root extraction, brand detection and Amazon scrape are independent,
+            # so they run concurrently (28-45%)
             if progress_callback:
-                await progress_callback(28, "Extracting root keywords...")
+                await progress_callback(28, "Extracting roots, detecting brands and scraping Amazon product...")
             
-            root_keywords = self.csv_processor.extract_root_keywords(design_rows, revenue_rows)
-            top_10_roots = [rk['keyword'] for rk in root_keywords[:10]]
-            logger.info(f"Top 10 roots: {top_10_roots}")
+            all_rows = design_rows + revenue_rows
+            all_keywords = list(dict.fromkeys(row['Keyword Phrase'] for row in all_rows))
             
-            # Step 5.5: Brand Detection (33-36%)
-            if progress_callback:
-                await progress_callback(33, "Detecting branded keywords...")
-            
-            all_keywords = list(set([row['Keyword Phrase'] for row in design_rows + revenue_rows]))
-            branded_kws, non_branded_kws = await self.brand_service.detect_brands(all_keywords)
-            
-            # Filter to non-branded for evaluation
-            non_branded_set = set(kw.lower() for kw in non_branded_kws)
-            filtered_rows = [row for row in design_rows + revenue_rows 
-                           if row['Keyword Phrase'].lower() in non_branded_set]
-            
-            # Keep branded rows for final output
-            branded_set = set(kw.lower() for kw in branded_kws)
-            branded_rows = [row for row in design_rows + revenue_rows 
-                          if row['Keyword Phrase'].lower() in branded_set]
+            root_keywords, (branded_kws, non_branded_kws), scrape_result = await asyncio.gather(
+                asyncio.to_thread(self.csv_processor.extract_root_keywords, design_rows, revenue_rows),
+                self.brand_service.detect_brands(all_keywords, progress_callback=progress_callback),
+                scrape_task
+            )
             
-            # Step 6: Scrape Amazon (35-45%)
-            if progress_callback:
-                await progress_callback(35, "Scraping Amazon product...")
+            top_10_roots = [rk['keyword'] for rk in root_keywords[:10]]
+            logger.info(f"Top 10 roots: {top_10_roots}")
             
-            scrape_result = self.scraper_service.scrape_product(
-                asin_or_url, marketplace, use_mock_scraper
-            )
+            # Partition rows in one pass: non-branded for evaluation, branded kept for final output.
+            # The normalized sets are built once and reused for the final brand lookup.
+            non_branded_set = {kw.strip().lower() for kw in non_branded_kws}
+            branded_set = {kw.strip().lower() for kw in branded_kws}
+            filtered_rows, branded_rows = self._partition_by_brand(all_rows, non_branded_set, branded_set)
             
             if not scrape_result.get("success"):
                 return self._handle_scrape_error(scrape_result)
@@ -111,44 +137,30 @@ class ResearchPipeline:
             if progress_callback:
                 await progress_callback(45, "Product data retrieved")
             
-            # Step 7: Filter by top 10 roots
-            keywords_to_evaluate = [
-                row['Keyword Phrase'] for row in filtered_rows
-                if any(root.lower() in row['Keyword Phrase'].lower() for root in top_10_roots)
-            ]
+            # Step 7: Filter by top 10 roots (one compiled multi-pattern scan per keyword)
+            roots_pattern = self._compile_roots_pattern(top_10_roots)
+            keywords_to_evaluate = self._match_roots(filtered_rows, roots_pattern)
             
             if not keywords_to_evaluate:
                 return self._success_response([], product_title, product_bullets, scraped_data, 
                                              asin_or_url, marketplace, top_10_roots)
             
-            # Step 8-9: Categorize keywords (70-95%)
+            # Step 8-10: Categorize and validate keywords in one LLM call per batch (70-95%)
             if progress_callback:
-                await progress_callback(70, "Categorizing keywords...")
+                await progress_callback(70, "Categorizing and validating keywords...")
             
-            categorizations = await self.categorization_service.categorize_keywords(
+            categorizations = await self._categorize_and_validate(
                 keywords_to_evaluate,
-                progress_callback=progress_callback
-            )
-            
-            # Step 10: Validate irrelevant keywords (95-98%)
-            if progress_callback:
-                await progress_callback(95, "Validating keywords...")
-            
-            categorized_for_validation = [
-                {'keyword': cat.get('keyword'), 'category': cat.get('category'), 
-                 'reasoning': cat.get('reasoning', '')}
-                for cat in categorizations
-            ]
-            
-            validation_checks = await self.validation_service.validate_keywords(
-                categorized_for_validation,
                 product_title,
                 product_bullets,
-                progress_callback=progress_callback
+                progress_callback
             )
             
-            # Update categories based on validation
-            categorizations = self._apply_validation(categorizations, validation_checks)
+            if progress_callback:
+                await progress_callback(95, "Keywords validated")
+            
+            # Single keyword -> CSV row index shared by enhanced categorization and finalize
+            row_index = self._build_row_index(filtered_rows)
             
             # Choose verification method based on toggle
             if use_direct_verification:
@@ -159,15 +171,13 @@ class ResearchPipeline:
                 
                 run_log.info("Using DIRECT verification method")
                 
-                # Merge with CSV data first
-                temp_merged = self._merge_with_csv_data(categorizations, filtered_rows)
-                
                 # Direct verification
                 verification_results = await self.direct_verification_service.verify_irrelevant_keywords(
-                    temp_merged,
+                    categorizations,
                     product_title,
                     product_bullets,
-                    progress_callback=progress_callback
+                    progress_callback=progress_callback,
+                    force_rescrape=force_rescrape
                 )
                 
                 # Apply results
@@ -184,12 +194,11 @@ class ResearchPipeline:
                 
                 run_log.info("Using ENHANCED categorization + verification method")
                 
-                # Merge with CSV data first to get search volumes
-                temp_merged = self._merge_with_csv_data(categorizations, filtered_rows)
-                
-                # Run enhanced categorization
-                enhanced_categories = self.enhanced_categorization_service.categorize_irrelevant_keywords(
-                    temp_merged
+                # Run enhanced categorization (blocking scrape + regex work) off the event loop
+                enhanced_categories = await asyncio.to_thread(
+                    self.enhanced_categorization_service.categorize_irrelevant_keywords,
+                    categorizations,
+                    row_index
                 )
                 
                 # Apply enhanced categories
@@ -200,22 +209,23 @@ class ResearchPipeline:
                     )
                 
                 # Step 11: Verify competitor_relevant keywords (98-99%)
-                competitor_kws = [cat for cat in categorizations 
-                                if cat.get('category') == 'competitor_relevant']
+                by_category = self._group_by_category(categorizations)
+                competitor_kws = by_category['competitor_relevant']
                 
                 if competitor_kws:
                     verification_results = await self.verification_service.verify_competitor_keywords(
                         competitor_kws,
                         product_title,
                         product_bullets,
-                        progress_callback=progress_callback
+                        progress_callback=progress_callback,
+                        force_rescrape=force_rescrape
                     )
                     
                     categorizations = self._apply_verification(categorizations, verification_results)
             
-            # Map categories to relevance scores
+            # Map categories to relevance scores (always an int, so the merge compares it directly)
             for cat in categorizations:
-                cat['relevance_score'] = self._map_category_to_score(cat.get('category', 'relevant'))
+                cat['relevance_score'] = CATEGORY_SCORE.get(cat.get('category', 'relevant'), DEFAULT_RELEVANCE_SCORE)
             
             # Step 12: Merge and finalize (99-100%)
             if progress_callback:
@@ -223,14 +233,17 @@ class ResearchPipeline:
             
             final_results = self._merge_and_finalize(
                 categorizations,
-                filtered_rows,
+                row_index,
                 branded_rows,
-                branded_kws,
-                non_branded_kws
+                branded_set,
+                non_branded_set
             )
             
-            # Save results
-            csv_filename = self._save_results(final_results, asin_or_url)
+            # Save results off the event loop, but before returning: the response hands
+            # csv_filename to the download endpoint, which must find the complete file
+            csv_filename = self._results_csv_path(asin_or_url)
+            if final_results:
+                await asyncio.to_thread(self._save_results, final_results, csv_filename)
             
             if progress_callback:
                 await progress_callback(100, "Complete!")
@@ -260,9 +273,69 @@ class ResearchPipeline:
                 "log_file": self.run_logger.get_log_file_path() if self.run_logger else None
             }
         finally:
+            # On an early return or error the scrape may still be pending; cancel it and retrieve
+            # its outcome so no "Task exception was never retrieved" is logged. Cancelling only
+            # abandons the wait: the to_thread worker (and a scraper subprocess that can run for
+            # up to 240s) keeps going in the background until it finishes on its own
+            if scrape_task is not None:
+                scrape_task.cancel()
+                await asyncio.gather(scrape_task, return_exceptions=True)
+            # Flush pending progress updates and artifact writes so none land after the run has returned
+            if self._background_tasks:
+                await asyncio.gather(*list(self._background_tasks), return_exceptions=True)
             if self.run_logger:
                 self.run_logger.cleanup()
     
+    def _partition_by_brand(self, rows, non_branded_set, branded_set):
+        """Split rows into (non-branded, branded) lowercasing each keyword once"""
+        non_branded_rows = []
+        branded_rows = []
+        for row in rows:
+            kw_lower = row['_kw_lower']
+            if kw_lower in non_branded_set:
+                non_branded_rows.append(row)
+            if kw_lower in branded_set:
+                branded_rows.append(row)
+        return non_branded_rows, branded_rows
+    
+    def _compile_roots_pattern(self, roots: List[str]) -> Optional[re.Pattern]:
+        """Compile root keywords into a single substring matcher over lowercased keywords
+
+        Roots come from CSVProcessor.extract_root_keywords, which tokenizes already
+        lowercased phrases, so they are matched as-is without another .lower().
+        """
+        roots = [root for root in roots if root]
+        if not roots:
+            return None
+        return re.compile("|".join(map(re.escape, roots)))
+    
+    def _match_roots(self, rows, roots_pattern: Optional[re.Pattern]) -> List[str]:
+        """Tag each row with the first root it contains (_matched_root) and return the matching keywords"""
+        keywords = []
+        for row in rows:
+            match = roots_pattern.search(row['_kw_lower']) if roots_pattern else None
+            row['_matched_root'] = match.group(0) if match else None
+            if match:
+                keywords.append(row['Keyword Phrase'])
+        return keywords
+    
+    def _nonblocking_progress(self, progress_callback):
+        """Wrap a progress callback so each update is scheduled instead of awaited inline"""
+        if not progress_callback:
+            return None
+        
+        async def emit(percent, message):
+            self._spawn_background(progress_callback(percent, message))
+        
+        return emit
+    
+    def _spawn_background(self, coro):
+        """Run a coroutine alongside the pipeline; awaited before the run returns"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+    
     def _process_csvs(self, design_content: bytes, revenue_content: bytes):
         """Process CSV files through dedup, filter, relevancy"""
         design_rows = self.csv_processor.parse_csv_content(design_content)
@@ -276,39 +349,77 @@ class ResearchPipeline:
         design_relevancy = self.csv_processor.add_relevancy(design_filtered) if design_filtered else []
         revenue_relevancy = self.csv_processor.add_relevancy(revenue_filtered) if revenue_filtered else []
         
+        # Cache the normalized keyword on each row; every later lookup reuses it
+        for rows in (design_relevancy, revenue_relevancy):
+            for row in rows:
+                row['_kw_lower'] = row['Keyword Phrase'].strip().lower()
+        
         return design_relevancy, revenue_relevancy
     
-    def _apply_validation(self, categorizations, validation_checks):
-        """Apply validation results to categorizations"""
-        irrelevant_lookup = {
-            check.get('keyword', '').lower(): check 
-            for check in validation_checks 
-            if check.get('is_irrelevant', False)
-        }
+    async def _categorize_and_validate(self, keywords, product_title, product_bullets, progress_callback=None):
+        """Categorize keywords and apply the fused irrelevance check from the same LLM call"""
+        categorizations = []
         
-        for cat in categorizations:
-            keyword_lower = cat.get('keyword', '').lower()
-            if keyword_lower in irrelevant_lookup:
-                irrelevant_info = irrelevant_lookup[keyword_lower]
-                cat['category'] = 'irrelevant'
-                cat['reasoning'] = irrelevant_info.get('reasoning', 'Does not match product')
+        # Without a title and bullets the irrelevance check has nothing to compare against
+        validate = bool(product_bullets) and bool((product_title or '').strip())
+        if validate:
+            batch_stream = self.categorization_service.categorize_and_validate_stream(
+                keywords,
+                product_title,
+                product_bullets,
+                progress_callback=progress_callback
+            )
+        else:
+            logger.warning("Skipping validation: insufficient product context (missing title or bullets)")
+            batch_stream = self.categorization_service.categorize_keywords_stream(
+                keywords,
+                progress_callback=progress_callback
+            )
+        
+        # Keep the irrelevant-classification artifact the separate validation pass used to write;
+        # nothing downstream reads it, so rows are streamed to disk as each batch arrives.
+        # Opening, writing and closing the file all run in a worker thread, off the event loop
+        results_writer = await asyncio.to_thread(ValidationResultsWriter) if validate else None
+        try:
+            async for batch_result in batch_stream:
+                batch_checks = []
+                for cat in batch_result:
+                    # Normalize each keyword once for the merge lookups that follow
+                    cat['_kw_lower'] = (cat.get('keyword') or '').strip().lower()
+                    is_irrelevant = bool(cat.pop('is_irrelevant', False))
+                    irrelevant_reasoning = cat.pop('irrelevant_reasoning', '')
+                    batch_checks.append({
+                        'keyword': cat.get('keyword'),
+                        'is_irrelevant': is_irrelevant,
+                        'reasoning': irrelevant_reasoning
+                    })
+                    if is_irrelevant:
+                        cat['category'] = 'irrelevant'
+                        cat['reasoning'] = irrelevant_reasoning or 'Does not match product'
+                if results_writer:
+                    await asyncio.to_thread(results_writer.write, batch_checks)
+                categorizations.extend(batch_result)
+        finally:
+            if results_writer:
+                await asyncio.to_thread(results_writer.close)
+        
+        logger.info(f"Categorization complete: {len(categorizations)} results (validated: {validate})")
         
         return categorizations
     
-    def _merge_with_csv_data(self, categorizations, filtered_rows):
-        """Merge categorizations with CSV data to get search volumes"""
-        merged = []
+    def _build_row_index(self, filtered_rows):
+        """Index CSV rows by normalized keyword (first occurrence wins)"""
+        row_index = {}
+        for row in filtered_rows:
+            row_index.setdefault(row['_kw_lower'], row)
+        return row_index
+    
+    def _group_by_category(self, categorizations):
+        """Bucket categorizations by their current category in a single pass"""
+        by_category = defaultdict(list)
         for cat in categorizations:
-            matching_row = next(
-                (row for row in filtered_rows 
-                 if row.get('Keyword Phrase', '').strip().lower() == cat.get('keyword', '').strip().lower()),
-                None
-            )
-            if matching_row:
-                merged.append({**cat, **matching_row})
-            else:
-                merged.append(cat)
-        return merged
+            by_category[cat.get('category')].append(cat)
+        return by_category
     
     def _apply_verification(self, categorizations, verification_results):
         """Apply verification results to categorizations"""
@@ -327,67 +438,70 @@ class ResearchPipeline:
         
         return categorizations
     
-    def _map_category_to_score(self, category: str) -> int:
-        """Map category to relevance score"""
-        mapping = {
-            'irrelevant': 3,
-            'competitor_relevant': 4,
-            'outlier': 5,
-            'relevant': 8,
-            'design_specific': 10,
-            'branded': 2
-        }
-        return mapping.get(category, 7)
-    
-    def _merge_and_finalize(self, categorizations, filtered_rows, branded_rows, 
-                           branded_kws, non_branded_kws):
-        """Merge categorizations with CSV data and add branded keywords"""
-        brand_lookup = {}
-        for kw in branded_kws:
-            brand_lookup[kw.lower()] = {'status': 'Branded', 'reasoning': 'Contains brand name'}
-        for kw in non_branded_kws:
-            brand_lookup[kw.lower()] = {'status': 'Non-Branded', 'reasoning': 'Generic term'}
+    def _merge_and_finalize(self, categorizations, row_index, branded_rows, 
+                           branded_set, non_branded_set):
+        """Merge categorizations with CSV data and add branded keywords (brand sets are pre-lowercased)"""
+        branded_info = {'status': 'Branded', 'reasoning': 'Contains brand name'}
+        non_branded_info = {'status': 'Non-Branded', 'reasoning': 'Generic term'}
+        brand_lookup = dict.fromkeys(branded_set, branded_info)
+        brand_lookup.update(dict.fromkeys(non_branded_set, non_branded_info))
+        unknown_info = {'status': 'Non-Branded', 'reasoning': 'N/A'}
         
-        merged = []
+        # Sized for the worst case (every keyword kept); trimmed to the filled prefix below
+        merged = [None] * (len(categorizations) + len(branded_rows))
+        filled = 0
         
-        # Add evaluated keywords
+        # Add evaluated keywords (internal _kw_lower/_matched_root keys are dropped from the output).
+        # The keep-filter is applied before an entry is built, so dropped keywords are never merged.
         for cat in categorizations:
-            matching_row = next(
-                (row for row in filtered_rows 
-                 if row.get('Keyword Phrase', '').strip().lower() == cat.get('keyword', '').strip().lower()),
-                None
-            )
-            if matching_row:
-                brand_info = brand_lookup.get(cat.get('keyword', '').lower(), {})
-                merged.append({
+            kw_lower = cat.pop('_kw_lower')
+            matching_row = row_index.get(kw_lower)
+            keep = (cat['relevance_score'] >= MIN_RELEVANCE_SCORE
+                    or cat.get('category') in ALWAYS_KEEP_CATEGORIES)
+            if matching_row and keep:
+                brand_info = brand_lookup.get(kw_lower, unknown_info)
+                entry = {
                     **cat,
                     **matching_row,
-                    'brand_status': brand_info.get('status', 'Non-Branded'),
-                    'brand_reasoning': brand_info.get('reasoning', 'N/A')
-                })
+                    'brand_status': brand_info['status'],
+                    'brand_reasoning': brand_info['reasoning']
+                }
+                del entry['_kw_lower']
+                entry.pop('_matched_root', None)
+                merged[filled] = entry
+                filled += 1
         
-        # Add branded keywords
+        # Add branded keywords (always kept)
         for row in branded_rows:
-            keyword = row.get('Keyword Phrase', '').strip()
-            brand_info = brand_lookup.get(keyword.lower(), {})
-            merged.append({
-                'keyword': keyword,
+            kw_lower = row['_kw_lower']
+            if not kw_lower:
+                continue
+            entry = {
+                'keyword': row['Keyword Phrase'].strip(),
                 'category': 'branded',
-                'relevance_score': 2,
+                'relevance_score': CATEGORY_SCORE['branded'],
                 'reasoning': 'Branded keyword - not evaluated',
                 'brand_status': 'Branded',
-                'brand_reasoning': brand_info.get('reasoning', 'Contains brand name'),
+                'brand_reasoning': brand_lookup.get(kw_lower, branded_info)['reasoning'],
                 **row
-            })
-        
-        # Filter and sort
-        merged = [row for row in merged if row.get('relevance_score', 0) >= 5 
-                 or row.get('category') in ['branded', 'irrelevant', 'competitor_relevant']]
-        
-        merged.sort(key=lambda x: int(x.get('Search Volume', 0)) if x.get('Search Volume') else 0, 
-                   reverse=True)
+            }
+            del entry['_kw_lower']
+            entry.pop('_matched_root', None)
+            merged[filled] = entry
+            filled += 1
         
-        return merged
+        del merged[filled:]
+        # Final order is by Search Volume, as it always was; relevance_score only filters rows
+        return self._sort_by_search_volume(merged)
+    
+    def _sort_by_search_volume(self, rows):
+        """Stable sort by Search Volume (descending); missing or non-numeric volumes count as 0"""
+        volumes = pd.to_numeric(
+            pd.Series([row.get('Search Volume') for row in rows], dtype=object),
+            errors='coerce'
+        ).fillna(0).astype('int64')
+        order = volumes.sort_values(ascending=False, kind='stable').index
+        return [rows[i] for i in order.tolist()]
     
     def _create_summary(self, title: str, bullets: List[str]) -> List[str]:
         """Create product summary"""
@@ -408,27 +522,38 @@ class ResearchPipeline:
             "keywords_final": final_count
         }
     
-    def _save_results(self, results: List[Dict], asin_or_url: str) -> str:
+    def _results_csv_path(self, asin_or_url: str) -> str:
+        """Path the results CSV for this run will be written to"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        asin_clean = asin_or_url.translate(FILENAME_UNSAFE_CHARS)[:50]
+        return str(Path("results") / f"keyword_evaluations_{asin_clean}_{timestamp}.csv")
+    
+    def _save_results(self, results: List[Dict], filename: str):
         """Save results to CSV"""
         try:
-            results_dir = Path("results")
-            results_dir.mkdir(exist_ok=True)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            asin_clean = asin_or_url.replace('/', '_').replace(':', '_')[:50]
-            filename = results_dir / f"keyword_evaluations_{asin_clean}_{timestamp}.csv"
-            
-            if results:
-                with open(filename, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=list(results[0].keys()))
-                    writer.writeheader()
-                    writer.writerows(results)
-                
-                logger.info(f"Saved results: {filename}")
+            Path(filename).parent.mkdir(exist_ok=True)
+            
+            # Union of columns in first-seen order: branded and evaluated rows differ
+            # (e.g. language_tag), which made a first-row-only DictWriter raise
+            fieldnames = list(dict.fromkeys(chain.from_iterable(results)))
+            # Pad each row from a blank template, then pull every field in one itemgetter call
+            template = dict.fromkeys(fieldnames, '')
+            if len(fieldnames) == 1:
+                # A single-key itemgetter returns a bare value, not a row tuple
+                field = fieldnames[0]
+
+                def project(row):
+                    return (row[field],)
+            else:
+                project = itemgetter(*fieldnames)
+            with open(filename, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                writer.writerows(project({**template, **row}) for row in results)
             
-            return str(filename)
+            logger.info(f"Saved results: {filename}")
         except Exception as e:
             logger.error(f"Error saving results: {str(e)}")
-            return ""
     
     def _error_response(self, message: str) -> Dict[str, Any]:
         """Create error response"""
@@ -0,0 +1,79 @@
+"""
+Request-rate limiting and retry helpers for LLM calls
+"""
+import logging
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+import openai
+
+logger = logging.getLogger(__name__)
+
+# Transient OpenAI failures worth retrying; anything else is raised immediately
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
+
+class AsyncRateLimiter:
+    """Token bucket allowing max_per_minute acquisitions, with bursts of up to `burst`"""
+
+    def __init__(self, max_per_minute: float, burst: int = 10):
+        self.rate = max_per_minute / 60.0
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def acquire(self):
+        """Wait until a request slot is available and take it"""
+        # Limiters are shared process-wide, so one can outlive the loop its lock was
+        # bound to (e.g. repeated asyncio.run); give each event loop its own lock
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+async def run_with_retry(
+    make_call: Callable[[], Awaitable[Any]],
+    attempts: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    limiter: Optional[AsyncRateLimiter] = None,
+    label: str = "LLM call",
+    timeout: Optional[float] = None
+) -> Any:
+    """
+    Await make_call(), retrying transient OpenAI errors with jittered exponential backoff
+
+    Each attempt first takes a slot from the limiter (if given). With a
+    timeout, an attempt running longer than timeout seconds is cancelled and
+    retried like any other transient failure.
+    """
+    for attempt in range(1, attempts + 1):
+        if limiter:
+            await limiter.acquire()
+        try:
+            return await asyncio.wait_for(make_call(), timeout)
+        except (*RETRYABLE_ERRORS, asyncio.TimeoutError) as e:
+            if attempt == attempts:
+                raise
+            delay = min(max_delay, base_delay * 2 ** (attempt - 1)) + random.uniform(0, base_delay)
+            logger.warning(f"{label} failed ({type(e).__name__}), retry {attempt}/{attempts - 1} in {delay:.1f}s")
+            await asyncio.sleep(delay)
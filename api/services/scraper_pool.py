@@ -0,0 +1,122 @@
+"""
+Event-loop keyword scraping shared by the verification services
+"""
+import logging
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Iterable, List, Optional, Tuple
+
+from Experimental.amazon_keyword_scraper import AmazonKeywordScraper, get_async_session
+from api.services.cache import SCRAPED_TITLES_CACHE
+
+logger = logging.getLogger(__name__)
+
+# Result-page parsing runs here rather than on the loop's default executor, so a burst
+# of parses can't starve other blocking work (and vice versa); sized like the app's pool
+_PARSE_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("SCRAPE_WORKERS", "8")),
+    thread_name_prefix="scraper"
+)
+
+
+class ScraperPool:
+    """
+    Scrapes keywords over one aiohttp session, at most `size` at a time
+
+    The session is warmed up once, before the first fetch, and its cookies are
+    reused for every keyword. A failed fetch re-warms the session on next use,
+    in case the failure was a lost or flagged session.
+    """
+
+    def __init__(self, size: int = 5, session=None):
+        self.size = max(1, size)
+        # Optional aiohttp.ClientSession; defaults to the scraper module's shared one
+        self.session = session
+        self._scraper = AmazonKeywordScraper()
+        self._warmed = False
+        self._warm_lock = asyncio.Lock()
+
+    async def _ensure_warm(self, session):
+        async with self._warm_lock:
+            if not self._warmed:
+                await self._scraper.async_warm_up(session)
+                self._warmed = True
+
+    async def scrape_titles(
+        self,
+        keyword: str,
+        limit: Optional[int] = None,
+        force_rescrape: bool = False
+    ) -> List[str]:
+        """
+        Fetch the first search page for keyword and return its organic titles
+
+        Non-empty results are cached for SCRAPE_CACHE_TTL seconds across runs;
+        force_rescrape bypasses the cached copy and refreshes it.
+        """
+        # Parsing stops after `limit` titles, so the limit is part of the key
+        cache_key = (keyword.strip().lower(), limit)
+        if not force_rescrape:
+            titles = SCRAPED_TITLES_CACHE.get(cache_key)
+            if titles is not None:
+                return list(titles)
+
+        session = self.session or get_async_session()
+        await self._ensure_warm(session)
+
+        try:
+            html = await self._scraper.async_scrape_search_html(keyword, page=1, session=session)
+        except Exception:
+            self._warmed = False
+            raise
+
+        # Parsing a results page is CPU-bound; keep it off the event loop
+        loop = asyncio.get_running_loop()
+        titles = await loop.run_in_executor(_PARSE_POOL, self._scraper.extract_product_titles, html, limit)
+        if titles:
+            SCRAPED_TITLES_CACHE.set(cache_key, titles)
+        return titles
+
+    async def iter_titles(
+        self,
+        keywords: Iterable[str],
+        limit: Optional[int] = None,
+        force_rescrape: bool = False,
+        max_concurrent: Optional[int] = None
+    ) -> AsyncIterator[Tuple[str, List[str]]]:
+        """
+        Scrape keywords `size` (or max_concurrent) at a time, yielding (keyword, titles) as each finishes
+
+        A keyword whose scrape fails yields an empty title list.
+        """
+        semaphore = asyncio.Semaphore(max_concurrent or self.size)
+
+        async def scrape_keyword(keyword: str):
+            async with semaphore:
+                try:
+                    return keyword, await self.scrape_titles(keyword, limit, force_rescrape)
+                except Exception as e:
+                    logger.warning(f"Error scraping '{keyword}': {str(e)}")
+                    return keyword, []
+
+        tasks = [asyncio.ensure_future(scrape_keyword(kw)) for kw in keywords]
+        scraped = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                keyword, titles = await next_done
+                scraped += 1
+                if titles:
+                    logger.info(f"Scraped {len(titles)} titles for '{keyword}'")
+                yield keyword, titles
+        finally:
+            # Scrapes are only still pending if the consumer stopped early
+            for task in tasks:
+                task.cancel()
+
+        logger.info(f"Scraping complete: {scraped} keywords")
+
+    def close_all(self):
+        """Release the pool's scraper (the aiohttp session stays open for its owner)"""
+        self._scraper.close()
+        self._warmed = False
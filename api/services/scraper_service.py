@@ -2,15 +2,28 @@
 Amazon scraping service
 """
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 from pathlib import Path
 from datetime import datetime
-import json
+import orjson
 
 from research_agents.helper_methods import scrape_amazon_listing
 
 logger = logging.getLogger(__name__)
 
+# Characters in an ASIN/URL that cannot appear in a results filename
+FILENAME_UNSAFE_CHARS = str.maketrans({'/': '_', ':': '_', '?': '_'})
+
+# Where bullets may live in scraped data, in priority order (first non-empty list wins)
+BULLET_FALLBACK_PATHS = (
+    ("elements", "feature-bullets", "bullets"),
+    ("elements", "productFactsDesktopExpander", "bullets"),
+    ("elements", "productFactsDesktopExpander", "items"),
+    ("bullets",),
+    ("features",),
+    ("feature_bullets",),
+)
+
 class ScraperService:
     """Handle Amazon product scraping"""
     
@@ -35,33 +48,8 @@ class ScraperService:
         
         scraped_data = scraped_result.get("data", {})
         
-        # Extract title
-        product_title = scraped_data.get("title", "")
-        if not product_title:
-            elements = scraped_data.get("elements", {})
-            title_data = elements.get("productTitle", {})
-            if title_data:
-                title_text = title_data.get("text", "")
-                product_title = title_text[0] if isinstance(title_text, list) else str(title_text)
-        
-        # Extract bullets
-        product_bullets = []
-        elements = scraped_data.get("elements", {})
-        
-        bullets_data = elements.get("feature-bullets", {})
-        if bullets_data:
-            product_bullets = bullets_data.get("bullets", [])
-        
-        if not product_bullets:
-            facts_data = elements.get("productFactsDesktopExpander", {})
-            if facts_data:
-                product_bullets = facts_data.get("bullets", []) or facts_data.get("items", [])
-        
-        if not product_bullets:
-            product_bullets = scraped_data.get("bullets", []) or scraped_data.get("features", [])
-        
-        if not product_bullets:
-            product_bullets = scraped_data.get("feature_bullets", [])
+        product_title = self._first_title(scraped_data)
+        product_bullets = self._first_bullets(scraped_data)
         
         logger.info(f"Extracted title and {len(product_bullets)} bullets")
         
@@ -75,17 +63,45 @@ class ScraperService:
             "bullets": product_bullets
         }
     
+    def _first_title(self, scraped_data: Dict[str, Any]) -> str:
+        """Product title, falling back to the productTitle element"""
+        product_title = scraped_data.get("title", "")
+        if product_title:
+            return product_title
+        
+        title_data = (scraped_data.get("elements") or {}).get("productTitle")
+        if not title_data:
+            return product_title
+        title_text = title_data.get("text", "")
+        return title_text[0] if isinstance(title_text, list) else str(title_text)
+    
+    def _first_bullets(self, scraped_data: Dict[str, Any]) -> List[str]:
+        """First non-empty bullet list across BULLET_FALLBACK_PATHS"""
+        return next(
+            (bullets for path in BULLET_FALLBACK_PATHS if (bullets := self._resolve(scraped_data, path))),
+            []
+        )
+    
+    @staticmethod
+    def _resolve(data: Dict[str, Any], path: Tuple[str, ...]) -> Any:
+        """Follow a key path through nested dicts; None if any step is missing"""
+        for key in path:
+            if not isinstance(data, dict):
+                return None
+            data = data.get(key)
+        return data
+    
     def _save_scraped_data(self, data: Dict, asin_or_url: str):
         """Save scraped data to JSON file"""
         try:
             results_dir = Path("results")
             results_dir.mkdir(exist_ok=True)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            asin_clean = asin_or_url.replace('/', '_').replace(':', '_').replace('?', '_')[:50]
+            asin_clean = asin_or_url.translate(FILENAME_UNSAFE_CHARS)[:50]
             file_path = results_dir / f"scraped_data_{asin_clean}_{timestamp}.json"
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
             
             logger.info(f"Saved scraped data: {file_path}")
         except Exception as e:
@@ -0,0 +1,288 @@
+"""
+Competitor-title verification shared by the verification services
+
+Several keywords are verified per LLM call; a keyword the batched answer
+misses (or a failed batch) falls back to the single-keyword agent.
+"""
+import logging
+import asyncio
+import os
+import time
+from typing import AsyncIterable, AsyncIterator, List, Dict, Any, Optional, Tuple
+
+from agents import Runner
+from api.services.agent_output import extract_structured_output
+from api.services.cache import VERIFICATION_CACHE
+from api.services.rate_limiting import AsyncRateLimiter, run_with_retry
+from research_agents.competitor_relevant_verification_agent import (
+    competitor_relevant_verification_agent,
+    competitor_relevant_batch_verification_agent,
+)
+
+logger = logging.getLogger(__name__)
+
+# Keywords per verification call; 1 sends every keyword on its own
+VERIFY_BATCH_SIZE = int(os.getenv("VERIFY_BATCH_SIZE", "8"))
+
+# Verification requests per minute, across every verification call in the process
+VERIFY_RPM = int(os.getenv("VERIFY_RPM", "500"))
+
+# One limiter per process, like the caches, so concurrent requests share the VERIFY_RPM budget
+VERIFY_RATE_LIMITER = AsyncRateLimiter(VERIFY_RPM)
+
+# Seconds before a single-keyword verification call is abandoned and retried
+VERIFY_TIMEOUT = float(os.getenv("VERIFY_TIMEOUT", "60"))
+
+# Progress is reported every 1/PROGRESS_STEPS of the keywords, or after this many seconds
+PROGRESS_STEPS = 20
+PROGRESS_MIN_INTERVAL = 0.5
+
+
+async def iter_verify_keywords_with_titles(
+    scraped: AsyncIterable[Tuple[str, List[str]]],
+    total: int,
+    product_title: str,
+    product_bullets: List[str],
+    max_concurrent: int,
+    progress_callback=None,
+    progress_range: Tuple[float, float] = (98, 99),
+    progress_label: str = "Verifying",
+    force_rescrape: bool = False,
+    batch_size: int = VERIFY_BATCH_SIZE,
+    rate_limiter: Optional[AsyncRateLimiter] = None
+) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Decide for each scraped keyword whether its competitor titles match our product
+
+    Consumes (keyword, titles) pairs as the scraper produces them and starts a
+    verification call as soon as batch_size keywords are ready, so scraping
+    and LLM calls overlap instead of running as two back-to-back phases.
+
+    Args:
+        scraped: (keyword, titles) pairs in completion order
+        total: Number of pairs scraped will yield (for progress)
+        rate_limiter: Paces every verification call (and retry), if given
+
+    Yields:
+        (keyword, verification result) pairs as each keyword is decided
+    """
+    decided: "asyncio.Queue" = asyncio.Queue()
+    finished = object()
+    semaphore = asyncio.Semaphore(max_concurrent)
+    # Same for every keyword in the run; build it once and lead each prompt with it
+    product_section = _product_section(product_title, product_bullets)
+    completed = 0
+    progress_lo, progress_hi = progress_range
+    report_every = max(1, total // PROGRESS_STEPS)
+    last_report = 0.0
+
+    async def mark_completed(count):
+        # No await between reading and updating the counter, so tasks can't interleave here
+        nonlocal completed, last_report
+        previous = completed
+        completed += count
+        if not progress_callback:
+            return
+        now = time.monotonic()
+        crossed_step = completed // report_every != previous // report_every
+        if crossed_step or completed >= total or now - last_report >= PROGRESS_MIN_INTERVAL:
+            last_report = now
+            progress = progress_lo + (completed / total) * (progress_hi - progress_lo)
+            await progress_callback(progress, f"{progress_label} ({completed}/{total})...")
+
+    async def verify_batch(batch):
+        async with semaphore:
+            if len(batch) > 1:
+                results = await _verify_many(batch, product_section, rate_limiter)
+            else:
+                results = {}
+
+            # Single-keyword path: batch size 1, or keywords the batched answer left out
+            for keyword, titles, titles_section, _ in batch:
+                if keyword not in results:
+                    results[keyword] = await _verify_one(
+                        keyword, titles, titles_section, product_section, rate_limiter
+                    )
+
+        for keyword, _, _, cache_key in batch:
+            result, ok = results[keyword]
+            decided.put_nowait((keyword, result))
+            if ok:
+                VERIFICATION_CACHE.set(cache_key, result)
+                logger.info(f"Verified '{keyword}': {result['verdict']}")
+
+        await mark_completed(len(batch))
+
+    async def feed():
+        tasks = []
+        ready = []
+        try:
+            async for keyword, titles in scraped:
+                if not titles:
+                    logger.warning(f"No titles for '{keyword}' - marking as irrelevant")
+                    decided.put_nowait((keyword, {
+                        'verdict': 'irrelevant',
+                        'match_percentage': 0,
+                        'reasoning': 'No competitor titles found'
+                    }))
+                    await mark_completed(1)
+                    continue
+
+                cache_key = (keyword, product_title, tuple(product_bullets), tuple(titles))
+                cached = None if force_rescrape else VERIFICATION_CACHE.get(cache_key)
+                if cached is not None:
+                    decided.put_nowait((keyword, cached))
+                    await mark_completed(1)
+                    continue
+
+                # Format the titles now, while earlier batches wait on the model
+                ready.append((keyword, titles, _titles_section(titles), cache_key))
+                if len(ready) == batch_size:
+                    tasks.append(asyncio.create_task(verify_batch(ready)))
+                    ready = []
+
+            if ready:
+                tasks.append(asyncio.create_task(verify_batch(ready)))
+
+            await asyncio.gather(*tasks)
+        finally:
+            # Only still running if feeding failed or the consumer stopped early
+            for task in tasks:
+                task.cancel()
+            decided.put_nowait(finished)
+
+    batch_size = max(1, batch_size)
+    feeder = asyncio.create_task(feed())
+    try:
+        while (item := await decided.get()) is not finished:
+            yield item
+        # Surface a failure of the scrape stream
+        await feeder
+    finally:
+        feeder.cancel()
+
+
+async def verify_keywords_with_titles(*args, **kwargs) -> Dict[str, Dict[str, Any]]:
+    """
+    Collect iter_verify_keywords_with_titles (same arguments) into a dict
+
+    Returns:
+        Dict mapping keyword to verification result (verdict, match_percentage, reasoning)
+    """
+    return {
+        keyword: result
+        async for keyword, result in iter_verify_keywords_with_titles(*args, **kwargs)
+    }
+
+
+def _product_section(product_title: str, product_bullets: List[str]) -> str:
+    return f"""Our Product:
+- Title: {product_title}
+- Bullets: {chr(10).join(f'  • {b}' for b in product_bullets)}"""
+
+
+def _titles_section(titles: List[str]) -> str:
+    numbered = "\n".join([f"{i+1}. {t}" for i, t in enumerate(titles)])
+    return f"""Top {len(titles)} Competitor Titles:
+{numbered}"""
+
+
+def _to_result(structured: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'verdict': structured.get('final_verdict', 'irrelevant'),
+        'match_percentage': structured.get('match_percentage', 0),
+        'reasoning': structured.get('reasoning', '')
+    }
+
+
+async def _verify_one(
+    keyword: str,
+    titles: List[str],
+    titles_section: str,
+    product_section: str,
+    rate_limiter: Optional[AsyncRateLimiter] = None
+) -> Tuple[Dict[str, Any], bool]:
+    """Verify a single keyword; returns (result, succeeded)"""
+    try:
+        logger.info(f"Verifying '{keyword}' with {len(titles)} titles")
+
+        prompt = f"""
+{product_section}
+
+Keyword: {keyword}
+
+{titles_section}
+
+Analyze each title and determine if it matches our product. Return the results in the specified JSON format.
+"""
+
+        result = await run_with_retry(
+            lambda: Runner.run(competitor_relevant_verification_agent, prompt),
+            max_delay=10.0,
+            limiter=rate_limiter,
+            label=f"Verification of '{keyword}'",
+            timeout=VERIFY_TIMEOUT
+        )
+        structured = extract_structured_output(getattr(result, "final_output", None))
+        return _to_result(structured), True
+
+    except Exception as e:
+        logger.warning(f"Error verifying '{keyword}': {str(e)}")
+        return {
+            'verdict': 'irrelevant',
+            'match_percentage': 0,
+            'reasoning': f'Verification error: {str(e)}'
+        }, False
+
+
+async def _verify_many(
+    batch: List[Tuple[str, List[str], str, Any]],
+    product_section: str,
+    rate_limiter: Optional[AsyncRateLimiter] = None
+) -> Dict[str, Tuple[Dict[str, Any], bool]]:
+    """
+    Verify several keywords in one call
+
+    Returns:
+        Results for the keywords the agent answered; missing ones are left to the caller
+    """
+    try:
+        logger.info(f"Verifying {len(batch)} keywords in one call")
+
+        keyword_blocks = "\n\n".join(
+            f"""[{i}] Keyword: {keyword}
+{titles_section}"""
+            for i, (keyword, _, titles_section, _) in enumerate(batch, 1)
+        )
+
+        prompt = f"""
+{product_section}
+
+Keywords to verify:
+
+{keyword_blocks}
+
+For each keyword, analyze its titles and determine if they match our product.
+Return one verification per keyword id in the specified JSON format.
+"""
+
+        result = await run_with_retry(
+            lambda: Runner.run(competitor_relevant_batch_verification_agent, prompt),
+            max_delay=10.0,
+            limiter=rate_limiter,
+            label=f"Verification batch of {len(batch)}",
+            # A batched answer is several verifications long
+            timeout=VERIFY_TIMEOUT * 2
+        )
+        structured = extract_structured_output(getattr(result, "final_output", None))
+
+    except Exception as e:
+        logger.warning(f"Error verifying batch of {len(batch)} keywords, retrying one by one: {str(e)}")
+        return {}
+
+    results = {}
+    for verification in structured.get('verifications', []):
+        keyword_id = verification.get('keyword_id')
+        if isinstance(keyword_id, int) and 1 <= keyword_id <= len(batch):
+            results[batch[keyword_id - 1][0]] = (_to_result(verification), True)
+    return results
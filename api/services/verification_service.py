@@ -2,190 +2,93 @@
 Competitor relevant verification service
 """
 import logging
-import asyncio
-from typing import List, Dict, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 
-from agents import Runner
-from research_agents.competitor_relevant_verification_agent import competitor_relevant_verification_agent
+from api.services.scraper_pool import ScraperPool
+from api.services.title_verification import VERIFY_RATE_LIMITER, iter_verify_keywords_with_titles
 
 logger = logging.getLogger(__name__)
 
 class VerificationService:
     """Handle competitor relevant keyword verification"""
     
-    async def verify_competitor_keywords(
+    def __init__(self, session=None, scraper_pool: Optional[ScraperPool] = None):
+        # Optional shared aiohttp.ClientSession for competitor-title scrapes
+        self.session = session
+        # Optional app-wide pool; without one, each call scrapes through its own
+        self.scraper_pool = scraper_pool
+    
+    async def iter_verify_competitor_keywords(
         self,
         competitor_keywords: List[Dict[str, Any]],
         product_title: str,
         product_bullets: List[str],
         max_concurrent: int = 5,
-        progress_callback=None
-    ) -> Dict[str, Dict[str, Any]]:
+        progress_callback=None,
+        force_rescrape: bool = False
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
         """
         Verify competitor_relevant keywords by scraping and analyzing
         
-        Returns:
-            Dict mapping keyword to verification result (verdict, match_percentage, reasoning)
-        """
-        if not competitor_keywords:
-            return {}
-        
-        logger.info(f"Verifying {len(competitor_keywords)} competitor_relevant keywords")
+        Scraped titles and verdicts are reused from earlier runs unless force_rescrape is set.
         
-        # Step 1: Scrape titles in parallel
-        scraped_titles = await self._scrape_titles_parallel(competitor_keywords)
-        
-        # Step 2: Verify with AI
-        verification_results = await self._verify_with_ai(
-            competitor_keywords,
-            scraped_titles,
-            product_title,
-            product_bullets,
-            max_concurrent,
-            progress_callback
-        )
-        
-        return verification_results
-    
-    async def _scrape_titles_parallel(
-        self, 
-        keywords: List[Dict[str, Any]]
-    ) -> Dict[str, List[str]]:
+        Yields:
+            (keyword, verification result) pairs as each keyword is verified
         """
-        Scrape competitor titles for keywords in parallel
-        Returns only first 6-8 organic (non-sponsored) titles per keyword
-        """
-        from Experimental.amazon_keyword_scraper import AmazonKeywordScraper
-        
-        scraped_titles = {}
-        
-        def scrape_keyword(keyword: str):
-            try:
-                scraper = AmazonKeywordScraper()
-                scraper.warm_up()
-                html = scraper.scrape_search_html(keyword, page=1)
-                titles = scraper.extract_product_titles(html)
-                scraper.close()
-                # Return only first 6-8 organic titles
-                return keyword, titles[:8]
-            except Exception as e:
-                logger.warning(f"Error scraping '{keyword}': {str(e)}")
-                return keyword, []
+        if not competitor_keywords:
+            return
         
-        keywords_to_scrape = [kw.get('keyword') for kw in keywords]
+        # A keyword listed twice is scraped and verified once; results are keyed by keyword
+        keywords = list(dict.fromkeys(kw.get('keyword') for kw in competitor_keywords))
+        if len(keywords) < len(competitor_keywords):
+            logger.info(f"Skipping {len(competitor_keywords) - len(keywords)} duplicate keywords")
         
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = {executor.submit(scrape_keyword, kw): kw for kw in keywords_to_scrape}
-            
-            for future in as_completed(futures):
-                keyword, titles = future.result()
-                scraped_titles[keyword] = titles
-                if titles:
-                    logger.info(f"Scraped {len(titles)} titles for '{keyword}'")
+        logger.info(f"Verifying {len(keywords)} competitor_relevant keywords")
         
-        logger.info(f"Scraping complete: {len(scraped_titles)} keywords")
-        return scraped_titles
+        # Scrape (first 6-8 organic titles per keyword) and verify concurrently:
+        # each keyword is queued for verification as soon as its titles arrive
+        pool = self.scraper_pool or ScraperPool(size=5, session=self.session)
+        try:
+            async for keyword, result in iter_verify_keywords_with_titles(
+                pool.iter_titles(keywords, limit=8, force_rescrape=force_rescrape),
+                len(keywords),
+                product_title,
+                product_bullets,
+                max_concurrent,
+                progress_callback,
+                progress_range=(98, 99),
+                progress_label="Verifying",
+                force_rescrape=force_rescrape,
+                rate_limiter=VERIFY_RATE_LIMITER
+            ):
+                yield keyword, result
+        finally:
+            if pool is not self.scraper_pool:
+                pool.close_all()
     
-    async def _verify_with_ai(
+    async def verify_competitor_keywords(
         self,
-        keywords: List[Dict[str, Any]],
-        scraped_titles: Dict[str, List[str]],
+        competitor_keywords: List[Dict[str, Any]],
         product_title: str,
         product_bullets: List[str],
-        max_concurrent: int,
-        progress_callback
+        max_concurrent: int = 5,
+        progress_callback=None,
+        force_rescrape: bool = False
     ) -> Dict[str, Dict[str, Any]]:
-        """Verify keywords using AI agent"""
-        verification_results = {}
-        semaphore = asyncio.Semaphore(max_concurrent)
-        completed = 0
-        
-        async def verify_keyword(keyword_data):
-            nonlocal completed
-            async with semaphore:
-                keyword = keyword_data.get('keyword')
-                titles = scraped_titles.get(keyword, [])
-                
-                if not titles:
-                    logger.warning(f"No titles for '{keyword}' - marking as irrelevant")
-                    verification_results[keyword] = {
-                        'verdict': 'irrelevant',
-                        'match_percentage': 0,
-                        'reasoning': 'No competitor titles found'
-                    }
-                    completed += 1
-                    return
-                
-                try:
-                    titles_text = "\n".join([f"{i+1}. {t}" for i, t in enumerate(titles)])
-                    
-                    prompt = f"""
-Keyword: {keyword}
-
-Our Product:
-- Title: {product_title}
-- Bullets: {chr(10).join(f'  • {b}' for b in product_bullets)}
-
-Top {len(titles)} Competitor Titles:
-{titles_text}
-
-Analyze each title and determine if it matches our product. Return the results in the specified JSON format.
-"""
-                    
-                    result = await Runner.run(competitor_relevant_verification_agent, prompt)
-                    output = getattr(result, "final_output", None)
-                    structured = self._extract_structured_output(output)
-                    
-                    verification_results[keyword] = {
-                        'verdict': structured.get('final_verdict', 'irrelevant'),
-                        'match_percentage': structured.get('match_percentage', 0),
-                        'reasoning': structured.get('reasoning', '')
-                    }
-                    
-                    logger.info(f"Verified '{keyword}': {verification_results[keyword]['verdict']}")
-                
-                except Exception as e:
-                    logger.warning(f"Error verifying '{keyword}': {str(e)}")
-                    verification_results[keyword] = {
-                        'verdict': 'irrelevant',
-                        'match_percentage': 0,
-                        'reasoning': f'Verification error: {str(e)}'
-                    }
-                
-                completed += 1
-                if progress_callback:
-                    progress = 98 + (completed / len(keywords)) * 1
-                    await progress_callback(progress, f"Verifying ({completed}/{len(keywords)})...")
+        """
+        Verify competitor_relevant keywords (see iter_verify_competitor_keywords)
         
-        tasks = [verify_keyword(kw) for kw in keywords]
-        await asyncio.gather(*tasks)
+        Returns:
+            Dict mapping keyword to verification result (verdict, match_percentage, reasoning)
+        """
+        verification_results = {
+            keyword: result
+            async for keyword, result in self.iter_verify_competitor_keywords(
+                competitor_keywords, product_title, product_bullets,
+                max_concurrent, progress_callback, force_rescrape
+            )
+        }
         
-        logger.info(f"Verification complete: {len(verification_results)} results")
+        if verification_results:
+            logger.info(f"Verification complete: {len(verification_results)} results")
         return verification_results
-    
-    def _extract_structured_output(self, output: Any) -> Dict[str, Any]:
-        """Extract structured data from agent output"""
-        if output and hasattr(output, "model_dump"):
-            return output.model_dump()
-        elif isinstance(output, dict):
-            return output
-        elif isinstance(output, str):
-            return self._extract_json_from_string(output)
-        return {}
-    
-    def _extract_json_from_string(self, text: str) -> Dict[str, Any]:
-        """Extract JSON from string"""
-        import re
-        import json
-        if not text:
-            return {}
-        matches = re.findall(r"\{[\s\S]*\}", text)
-        for snippet in reversed(matches):
-            try:
-                obj = json.loads(snippet)
-                if isinstance(obj, dict):
-                    return obj
-            except Exception:
-                continue
-        return {}
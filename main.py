@@ -2,14 +2,18 @@
 FastAPI Application for Amazon Product Research
 Processes CSV files and ASIN/URL in memory without intermediate files
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 import uvicorn
 import logging
+import aiohttp
 from pathlib import Path
 
 from api.endpoints import research
+from api.services.scraper_pool import ScraperPool
+from Experimental.amazon_keyword_scraper import AmazonKeywordScraper, close_async_session
 
 # Configure logging
 logging.basicConfig(
@@ -17,10 +21,26 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Share one keep-alive HTTP session and warmed scraper pool across requests"""
+    app.state.http = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=60)
+    )
+    app.state.scraper_pool = ScraperPool(size=8, session=app.state.http)
+    # Pooled requests session for the synchronous top-keyword scrapes
+    app.state.requests_session = AmazonKeywordScraper.create_session(pool_connections=10, pool_maxsize=20)
+    yield
+    app.state.scraper_pool.close_all()
+    app.state.requests_session.close()
+    await app.state.http.close()
+    await close_async_session()
+
 app = FastAPI(
     title="Amazon Product Research API",
     description="Analyze Amazon products with design and revenue keyword data",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Mount static files
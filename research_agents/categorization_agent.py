@@ -18,7 +18,8 @@ categorization_agent = Agent(
     instructions=CATEGORIZATION_AGENT_INSTRUCTIONS,
     model="gpt-5",
     model_settings=ModelSettings(
-        max_tokens=5000,
+        # Also sizes each batch: 32 keywords at OUTPUT_TOKENS_PER_KEYWORD (500) apiece
+        max_tokens=16000,
     ),
     output_type=AgentOutputSchema(KeywordCategorizationResult, strict_json_schema=False),
 )
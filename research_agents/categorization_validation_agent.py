@@ -0,0 +1,25 @@
+"""
+Keyword Categorization + Validation Agent
+
+Categorizes keywords (Outlier, Relevant, Design-Specific) and validates them
+against the product title/bullets for irrelevance in a single call
+"""
+from agents import Agent, ModelSettings
+from dotenv import load_dotenv, find_dotenv
+from agents import AgentOutputSchema
+from research_agents.prompts import CATEGORIZATION_AND_VALIDATION_AGENT_INSTRUCTIONS
+from research_agents.schemas import KeywordCategorizationValidationResult
+
+load_dotenv(find_dotenv())
+
+
+categorization_validation_agent = Agent(
+    name="CategorizationValidationAgent",
+    instructions=CATEGORIZATION_AND_VALIDATION_AGENT_INSTRUCTIONS,
+    model="gpt-5",
+    model_settings=ModelSettings(
+        # Also sizes each batch: 32 keywords at OUTPUT_TOKENS_PER_KEYWORD (500) apiece
+        max_tokens=16000,
+    ),
+    output_type=AgentOutputSchema(KeywordCategorizationValidationResult, strict_json_schema=False),
+)
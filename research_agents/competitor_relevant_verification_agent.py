@@ -8,21 +8,45 @@ Verifies if competitor_relevant keywords are actually relevant by:
 4. If >50% match → mark as relevant
 5. If <=50% match → mark as irrelevant
 """
+import os
 from agents import Agent, ModelSettings
 from dotenv import load_dotenv, find_dotenv
 from agents import AgentOutputSchema
-from research_agents.prompts import COMPETITOR_RELEVANT_VERIFICATION_INSTRUCTIONS
-from research_agents.schemas import CompetitorRelevantVerificationResult
+from research_agents.prompts import (
+    COMPETITOR_RELEVANT_VERIFICATION_INSTRUCTIONS,
+    COMPETITOR_RELEVANT_BATCH_VERIFICATION_INSTRUCTIONS,
+)
+from research_agents.schemas import (
+    CompetitorRelevantVerificationResult,
+    CompetitorRelevantBatchVerificationResult,
+)
 
 load_dotenv(find_dotenv())
 
+# Verification only has to judge a handful of titles, which the mini tier handles
+COMPETITOR_VERIFICATION_AGENT_MODEL = os.getenv("COMPETITOR_VERIFICATION_AGENT_MODEL", "gpt-4o-mini")
 
 competitor_relevant_verification_agent = Agent(
     name="CompetitorRelevantVerificationAgent",
     instructions=COMPETITOR_RELEVANT_VERIFICATION_INSTRUCTIONS,
-    model="gpt-4o",
+    model=COMPETITOR_VERIFICATION_AGENT_MODEL,
     model_settings=ModelSettings(
-        max_tokens=8000,
+        temperature=0,
+        # Verdict plus one short analysis per title (8 titles)
+        max_tokens=2000,
     ),
     output_type=AgentOutputSchema(CompetitorRelevantVerificationResult),
 )
+
+
+# Same verification for several keywords per call (each with its own titles)
+competitor_relevant_batch_verification_agent = Agent(
+    name="CompetitorRelevantBatchVerificationAgent",
+    instructions=COMPETITOR_RELEVANT_BATCH_VERIFICATION_INSTRUCTIONS,
+    model=COMPETITOR_VERIFICATION_AGENT_MODEL,
+    model_settings=ModelSettings(
+        temperature=0,
+        max_tokens=16000,
+    ),
+    output_type=AgentOutputSchema(CompetitorRelevantBatchVerificationResult),
+)
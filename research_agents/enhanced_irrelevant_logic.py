@@ -4,8 +4,13 @@ Categorizes irrelevant keywords as either 'irrelevant' or 'competitor_relevant'
 by scraping competitor titles and checking if modifiers appear in them.
 """
 import logging
-from typing import List, Dict, Any
-from research_agents.modifier_extractor import extract_modifiers, find_modifier_in_titles
+from itertools import chain
+from typing import List, Dict, Any, Tuple
+from research_agents.modifier_extractor import (
+    extract_modifiers,
+    find_many_modifiers_in_titles,
+    get_relevant_words,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,38 +39,56 @@ def categorize_irrelevant_keywords(
         Dict mapping keyword to category ('irrelevant' or 'competitor_relevant')
     """
     categories = {}
+    relevant_words = get_relevant_words(relevant_keywords)
+    keyword_modifiers = {
+        keyword: extract_modifiers(keyword, relevant_keywords, relevant_words)
+        for keyword in irrelevant_keywords
+    }
     
-    for keyword in irrelevant_keywords:
-        # Extract meaningful modifiers
-        modifiers = extract_modifiers(keyword, relevant_keywords)
-        
-        if not modifiers:
-            # No meaningful modifiers → irrelevant
-            categories[keyword] = 'irrelevant'
-            logger.debug(f"'{keyword}' → irrelevant (no meaningful modifiers)")
-            continue
-        
-        # Check if any modifier appears in competitor titles
-        found_in_titles = False
-        for modifier in modifiers:
-            found, matching_titles = find_modifier_in_titles(modifier, competitor_titles)
-            if found:
-                found_in_titles = True
-                logger.debug(f"'{keyword}': modifier '{modifier}' found in {len(matching_titles)} competitor titles")
-                break
-        
-        if found_in_titles:
+    # Search for every distinct modifier in one pass over the titles
+    all_modifiers = dict.fromkeys(chain.from_iterable(keyword_modifiers.values()))
+    modifier_matches = {
+        modifier: len(matching_titles)
+        for modifier, matching_titles in find_many_modifiers_in_titles(all_modifiers, competitor_titles).items()
+    }
+    
+    for keyword, modifiers in keyword_modifiers.items():
+        category, reason = _classify_one(modifiers, modifier_matches)
+        categories[keyword] = category
+        logger.debug(f"'{keyword}' → {category} ({reason})")
+    
+    return categories
+
+
+def _classify_one(
+    modifiers: List[str],
+    modifier_matches: Dict[str, int]
+) -> Tuple[str, str]:
+    """
+    Categorize a single irrelevant keyword from its modifiers.
+    
+    Args:
+        modifiers: The keyword's meaningful modifiers
+        modifier_matches: Number of competitor titles each modifier appears in
+    
+    Returns:
+        (category, reason for the debug log)
+    """
+    if not modifiers:
+        # No meaningful modifiers → irrelevant
+        return 'irrelevant', 'no meaningful modifiers'
+    
+    # Check if any modifier appears in competitor titles
+    for modifier in modifiers:
+        if modifier_matches[modifier]:
             # Modifiers found in competitor titles → competitor_relevant
             # (market demand exists for this variation, but we don't offer it)
-            categories[keyword] = 'competitor_relevant'
-            logger.debug(f"'{keyword}' → competitor_relevant (modifiers found in competitor titles)")
-        else:
-            # Modifiers NOT found in competitor titles → irrelevant
-            # (no market demand for this variation)
-            categories[keyword] = 'irrelevant'
-            logger.debug(f"'{keyword}' → irrelevant (modifiers not found in competitor titles)")
+            reason = f"modifier '{modifier}' found in {modifier_matches[modifier]} competitor titles"
+            return 'competitor_relevant', reason
     
-    return categories
+    # Modifiers NOT found in competitor titles → irrelevant
+    # (no market demand for this variation)
+    return 'irrelevant', 'modifiers not found in competitor titles'
 
 
 class EnhancedIrrelevantCategorizer:
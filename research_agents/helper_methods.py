@@ -4,7 +4,7 @@ Helper Methods for Research Agent
 Contains utility functions for Amazon scraping.
 """
 
-import json
+import orjson
 import subprocess
 import sys
 import traceback
@@ -94,8 +94,8 @@ def scrape_amazon_listing(asin_or_url: str, marketplace: str = "US", use_mock: b
             }
 
         try:
-            container = json.loads(result.stdout.strip())
-        except json.JSONDecodeError as e:
+            container = orjson.loads(result.stdout.strip())
+        except orjson.JSONDecodeError as e:
             return {
                 "success": False,
                 "error": f"Failed to parse scraper output: {str(e)}",
@@ -3,7 +3,8 @@ Utility module for extracting meaningful modifiers from irrelevant keywords
 and matching them against competitor titles using word boundaries.
 """
 import re
-from typing import List, Set, Tuple
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 
 # Stop words that don't carry meaningful information
@@ -20,9 +21,30 @@ STOP_WORDS = {
 }
 
 
+def get_relevant_words(relevant_keywords: List[str]) -> Set[str]:
+    """
+    Collect the punctuation-stripped words of the relevant keywords.
+    
+    Args:
+        relevant_keywords: List of top 3 relevant keywords
+    
+    Returns:
+        Set of lowercase words
+    """
+    relevant_words = set()
+    for kw in relevant_keywords:
+        kw_words = kw.lower().split()
+        for word in kw_words:
+            clean_word = re.sub(r'[^\w\s-]', '', word)
+            if clean_word:
+                relevant_words.add(clean_word)
+    return relevant_words
+
+
 def extract_modifiers(
     irrelevant_keyword: str,
-    relevant_keywords: List[str]
+    relevant_keywords: List[str],
+    relevant_words: Optional[Set[str]] = None
 ) -> List[str]:
     """
     Extract meaningful modifiers from an irrelevant keyword by:
@@ -33,6 +55,8 @@ def extract_modifiers(
     Args:
         irrelevant_keyword: The irrelevant keyword to analyze
         relevant_keywords: List of top 3 relevant keywords
+        relevant_words: get_relevant_words(relevant_keywords), when the caller
+            checks many keywords against the same relevant keywords
     
     Returns:
         List of meaningful modifiers
@@ -40,15 +64,9 @@ def extract_modifiers(
     # Convert to lowercase and split
     words = irrelevant_keyword.lower().split()
     
-    # Create a set of words from relevant keywords for quick lookup
-    # This dynamically extracts all words from the top 3 relevant keywords
-    relevant_words = set()
-    for kw in relevant_keywords:
-        kw_words = kw.lower().split()
-        for word in kw_words:
-            clean_word = re.sub(r'[^\w\s-]', '', word)
-            if clean_word:
-                relevant_words.add(clean_word)
+    # Words from the top 3 relevant keywords, for quick lookup
+    if relevant_words is None:
+        relevant_words = get_relevant_words(relevant_keywords)
     
     # Extract meaningful modifiers
     modifiers = []
@@ -90,6 +108,42 @@ def find_modifier_in_titles(
     return found, matching_titles
 
 
+def find_many_modifiers_in_titles(
+    modifiers: Iterable[str],
+    titles: List[str]
+) -> Dict[str, List[str]]:
+    """
+    Search for several modifiers in titles at once, with the same word-boundary
+    rule as find_modifier_in_titles.
+    
+    A modifier made only of word characters matches exactly when it is one of
+    a title's whole words, so those are looked up in a word index built with a
+    single pass over the titles; any other modifier (e.g. hyphenated) falls
+    back to find_modifier_in_titles.
+    
+    Args:
+        modifiers: The modifiers to search for
+        titles: List of titles to search in
+    
+    Returns:
+        Dict mapping each modifier to its matching titles (empty list if none)
+    """
+    titles_by_word = defaultdict(list)
+    for title in titles:
+        for word in set(re.findall(r'\w+', title.lower())):
+            titles_by_word[word].append(title)
+    
+    matches = {}
+    for modifier in modifiers:
+        modifier_lower = modifier.lower()
+        if re.fullmatch(r'\w+', modifier_lower):
+            matches[modifier] = list(titles_by_word.get(modifier_lower, ()))
+        else:
+            _, matches[modifier] = find_modifier_in_titles(modifier, titles)
+    
+    return matches
+
+
 def extract_modifiers_from_keyword(keyword: str) -> List[str]:
     """
     Extract modifiers from a single keyword by removing stop words.
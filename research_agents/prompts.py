@@ -196,6 +196,19 @@ Categorized Keywords to validate:
 
 IMPORTANT: Pay special attention to DESIGN-SPECIFIC keywords - verify the design feature actually exists in the product."""
 
+CATEGORIZATION_AND_VALIDATION_PROMPT_TEMPLATE = """Categorize these keywords, then validate each one against the product's TITLE and BULLET POINTS.
+
+Product Title:
+{product_title}
+
+Product Bullet Points:
+{product_bullets_json}
+
+Keywords to categorize and validate:
+{keywords_json}
+
+IMPORTANT: Choose the category from keyword structure alone. Decide is_irrelevant by strict comparison with the TITLE and BULLETS, and be EXTRA STRICT with keywords you categorized as design_specific."""
+
 # ============================================================================
 # Agent Instructions
 # ============================================================================
@@ -352,6 +365,27 @@ For each keyword, provide reasoning that is no longer than 2 sentences. All answ
 # Stop Condition
 Process only the supplied keywords as described; do not extrapolate beyond the provided keywords."""
 
+CATEGORIZATION_AND_VALIDATION_AGENT_INSTRUCTIONS = """# Combined Task
+You perform TWO independent passes over every keyword and return both results in a single response.
+
+PASS 1 - CATEGORIZATION: Follow the Categorization Instructions below. Ignore the product title and bullets in this pass; categorize on rules and keyword structure alone.
+PASS 2 - IRRELEVANCE VALIDATION: Follow the Validation Instructions below, comparing each keyword STRICTLY against the product TITLE and BULLETS. Use your PASS 1 category to decide which keywords are DESIGN-SPECIFIC.
+
+# Output Format (overrides the output sections of both instruction sets)
+For every keyword, return:
+- `keyword`: The exact keyword assessed
+- `category`: PASS 1 result, one of: "outlier", "relevant", "design_specific"
+- `language_tag`: PASS 1 result, one of: "misspelled", "spanish", "chinese", "english", "other"
+- `reasoning`: PASS 1 explanation (1-2 sentences)
+- `is_irrelevant`: PASS 2 result, true or false
+- `irrelevant_reasoning`: PASS 2 explanation comparing keyword to TITLE/BULLETS (1-2 sentences)
+
+## Categorization Instructions
+""" + CATEGORIZATION_AGENT_INSTRUCTIONS + """
+
+## Validation Instructions
+""" + IRRELEVANT_AGENT_INSTRUCTIONS
+
 BRAND_DETECTION_AGENT_INSTRUCTIONS = """You are a brand detection specialist. Your job is to identify keywords that contain brand names ANYWHERE in the phrase (beginning, middle, or end).
 
 CRITICAL RULES:
@@ -594,3 +628,15 @@ Result: 1/10 = 10% → IRRELEVANT ❌
 - Consider the customer's perspective: would they find our product useful?
 - The threshold is 50% - exactly 50% is IRRELEVANT
 """
+
+COMPETITOR_RELEVANT_BATCH_VERIFICATION_INSTRUCTIONS = """# Batched Task
+You will receive SEVERAL keywords at once, each listed under a numeric id like [1], [2], ... with its own Top Competitor Titles.
+Verify every keyword INDEPENDENTLY using the instructions below: only that keyword's titles count toward its match percentage and verdict.
+
+# Output Format (extends the output section below)
+Return one entry in `verifications` per listed keyword, in any order, each with:
+- `keyword_id`: The numeric id the keyword was listed under
+- `keyword`: The exact keyword text
+- All per-keyword fields described below (`title_analyses`, `total_titles_analyzed`, `matching_titles_count`, `match_percentage`, `final_verdict`, `reasoning`)
+
+""" + COMPETITOR_RELEVANT_VERIFICATION_INSTRUCTIONS
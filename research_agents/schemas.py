@@ -103,6 +103,25 @@ class KeywordCategorizationResult(BaseModel):
     categorizations: List[KeywordCategory] = Field(description="Categorization for each keyword")
 
 
+class KeywordCategoryValidation(BaseModel):
+    """Individual keyword categorization with irrelevance check"""
+    model_config = ConfigDict(extra='forbid')
+    keyword: str
+    category: str = Field(description="One of: outlier, relevant, design_specific")
+    language_tag: Optional[str] = Field(default=None, description="misspelled, spanish, french, etc. or None if English")
+    reasoning: str = Field(description="Brief explanation of categorization")
+    is_irrelevant: bool = Field(description="True if keyword is irrelevant to the product")
+    irrelevant_reasoning: str = Field(description="Brief explanation of why keyword is or isn't irrelevant")
+
+
+class KeywordCategorizationValidationResult(BaseModel):
+    """Result from combined categorization and validation agent"""
+    model_config = ConfigDict(extra='forbid')
+    categorizations: List[KeywordCategoryValidation] = Field(
+        description="Categorization and irrelevance check for each keyword"
+    )
+
+
 # ============================================================================
 # Enhanced Irrelevant Categorization Schemas
 # ============================================================================
@@ -145,3 +164,16 @@ class CompetitorRelevantVerificationResult(BaseModel):
     title_analyses: List[TitleMatchAnalysis] = Field(description="Analysis of each title")
     final_verdict: str = Field(description="'relevant' if >50% match, 'irrelevant' if <=50% match")
     reasoning: str = Field(description="Overall reasoning for the verdict")
+
+
+class CompetitorRelevantKeywordVerification(CompetitorRelevantVerificationResult):
+    """Verification of one keyword within a batched request"""
+    keyword_id: int = Field(description="The numeric id the keyword was listed under in the prompt")
+
+
+class CompetitorRelevantBatchVerificationResult(BaseModel):
+    """Result from the batched competitor relevant verification agent"""
+    model_config = ConfigDict(extra='forbid')
+    verifications: List[CompetitorRelevantKeywordVerification] = Field(
+        description="One verification per listed keyword"
+    )
@@ -41,6 +41,16 @@ except ImportError:
 class AmazonScraperV2:
     """Enhanced Amazon scraper with anti-blocking features."""
     
+    # Statuses that will not change on retry (missing/invalid product page)
+    PERMANENT_STATUS_CODES = {400, 404, 410}
+    
+    # Errors raised before any request is sent (malformed URL)
+    PERMANENT_REQUEST_ERRORS = (
+        requests.exceptions.InvalidURL,
+        requests.exceptions.MissingSchema,
+        requests.exceptions.InvalidSchema,
+    )
+    
     USER_AGENTS = [
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
@@ -105,6 +115,10 @@ class AmazonScraperV2:
     def _random_delay(self, min_seconds: float = 1.5, max_seconds: float = 3.5):
         time.sleep(random.uniform(min_seconds, max_seconds))
     
+    def _backoff(self, attempt: int, max_seconds: float = 60):
+        """Exponential backoff with jitter before retrying a transient failure"""
+        time.sleep(min(max_seconds, 2 ** attempt + random.uniform(0, 1)))
+    
     def _parse_html(self, html: str, url: str) -> Dict[str, Any]:
         """Parse HTML and extract product information."""
         soup = BeautifulSoup(html, 'html.parser')
@@ -361,11 +375,12 @@ class AmazonScraperV2:
                     if "captcha" in html.lower() or "robot check" in html.lower():
                         result["error"] = "CAPTCHA detected"
                         if attempt < self.max_retries:
-                            time.sleep(2 ** attempt)
+                            self._backoff(attempt)
                             continue
                     elif len(html) < 5000:
                         result["error"] = f"Response too short ({len(html)} bytes)"
                         if attempt < self.max_retries:
+                            self._backoff(attempt)
                             continue
                     else:
                         # Success - parse HTML
@@ -374,13 +389,20 @@ class AmazonScraperV2:
                         break
                 else:
                     result["error"] = f"HTTP {response.status_code}"
+                    result["status_code"] = response.status_code
+                    if response.status_code in self.PERMANENT_STATUS_CODES:
+                        # Missing/invalid product page: retrying cannot help
+                        break
                     if attempt < self.max_retries:
-                        time.sleep(2 ** attempt)
+                        self._backoff(attempt)
             
+            except self.PERMANENT_REQUEST_ERRORS as e:
+                result["error"] = str(e)
+                break
             except Exception as e:
                 result["error"] = str(e)
                 if attempt < self.max_retries:
-                    time.sleep(2 ** attempt)
+                    self._backoff(attempt)
         
         return result
     